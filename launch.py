@@ -1,19 +1,32 @@
+from __future__ import annotations
+
 import argparse
-from functools import partial
+import shlex
 import sys
-from typing import TypeVar
+from typing import TYPE_CHECKING
 
 # Add package: Vitis Python CLI
-import vitis  # type: ignore
-vitis_client = TypeVar('vitis_client')
+# Imported lazily through _get_vitis(), commands without a client never load it
+vitis = None
+_vitis_client_created = False
+if TYPE_CHECKING:
+    from typing import TypeVar
+    vitis_client = TypeVar('vitis_client')
+
+from vitis_logging import Logger, cleanupLatestLog
+
 
-from vitis_logging import *
-from vitis_create import create_workspace, ProjectCreator
-from vitis_build import activate_project, build_project_ninja, build_project_vitis, build_project_all, build_project_all_ninja
-from vitis_update import ProjectUpdater
+def _get_vitis():
+    """Import the Vitis Python CLI on first use."""
+    global vitis
+    if vitis is None:
+        import vitis  # type: ignore
+    return vitis
 
 
 def project_creator_wrapper(client: vitis_client, args: argparse.Namespace) -> None: # pyright: ignore[reportInvalidTypeVarUse]
+    from vitis_create import ProjectCreator
+
     creator = ProjectCreator(client, args)
     creator.create()
 
@@ -28,6 +41,8 @@ def create_application_wrapper(client: vitis_client, args: argparse.Namespace) -
 
 def activate_project_wrapper(args: argparse.Namespace) -> None:
     """Wrapper for ACTIVATE command (no Vitis client needed)."""
+    from vitis_build import activate_project
+
     success = activate_project(args.name)
     if not success:
         sys.exit(1)
@@ -35,48 +50,55 @@ def activate_project_wrapper(args: argparse.Namespace) -> None:
 
 def build_project_wrapper(args: argparse.Namespace, client: vitis_client = None) -> None: # pyright: ignore[reportInvalidTypeVarUse]
     """Wrapper for BUILD command."""
+    from vitis_build import (
+        activate_project, build_project_ninja, build_project_vitis, build_project_all, build_project_all_ninja
+    )
+
+    name = args.name
+    tools = args.tools
+    clean = args.clean
+    activate = args.activate
+    use_system = getattr(args, 'system_ninja', False)
+    parallel = getattr(args, 'parallel', False)
+    incremental = getattr(args, 'incremental', False)
 
     # Check if building entire project
     if args.all:
-        # Determine build tool
-        tools = args.tools
-
         if tools == "ninja":
             # Ninja-based full project build
-            use_system = getattr(args, 'system_ninja', False)
             exit_code = build_project_all_ninja(
-                args.name,
-                clean=args.clean,
-                use_system_ninja=use_system
+                name,
+                clean=clean,
+                use_system_ninja=use_system,
+                parallel=parallel,
+                incremental=incremental
             )
         else:
             # Vitis-based full project build
             if client is None:
                 log.error("--all with --tools vitis requires Vitis client")
                 sys.exit(1)
-            exit_code = build_project_all(client, args.name)
+            exit_code = build_project_all(client, name)
 
         # Activate project after build (unless --no-activate)
-        if exit_code == 0 and args.activate:
-            success = activate_project(args.name)
+        if exit_code == 0 and activate:
+            success = activate_project(name)
             sys.exit(0 if success else 1)
         else:
             sys.exit(exit_code)
 
     # Single application build
-    tools = args.tools
-
     if tools == "ninja":
         # Direct ninja build
-        use_system = getattr(args, 'system_ninja', False)
-        exit_code = build_project_ninja(args.name, clean=args.clean, use_system_ninja=use_system)
+        exit_code = build_project_ninja(name, clean=clean, use_system_ninja=use_system)
     else:
         # Vitis server build
-        exit_code = build_project_vitis(client, args.name)
+        exit_code = build_project_vitis(client, name)
 
     # Activate the project after build (unless --no-activate)
-    if exit_code == 0 and args.activate:
-        activate_project(args.name)
+    # A successful single build has already confirmed the project directory exists
+    if exit_code == 0 and activate:
+        activate_project(name, project_dir_verified=True)
 
     if exit_code != 0:
         sys.exit(exit_code)
@@ -84,37 +106,62 @@ def build_project_wrapper(args: argparse.Namespace, client: vitis_client = None)
 
 def update_project_wrapper(client: vitis_client, args: argparse.Namespace) -> None:  # pyright: ignore[reportInvalidTypeVarUse]
     """Wrapper for UPDATE command."""
+    from vitis_update import ProjectUpdater
+
     updater = ProjectUpdater(client, args)
     updater.update()
 
 
-def launch_client():
-    parser = argparse.ArgumentParser(
-        prog="Vitis Workspace Builder"
-    )
-    subparser = parser.add_subparsers(dest='command')
+def serve_wrapper(client: vitis_client, args: argparse.Namespace) -> None:  # pyright: ignore[reportInvalidTypeVarUse]
+    """Wrapper for SERVE command: runs commands read from stdin, one per line, with a single Vitis client."""
+    log.info("Serving commands from stdin")
+
+    for line in sys.stdin:
+        argv = shlex.split(line, comments=True)
+        if not argv:
+            continue
 
+        if argv[0] == "SERVE":
+            log.error("SERVE cannot be nested, skipping")
+            continue
+
+        log.info(f"Running: {' '.join(argv)}")
+        try:
+            _dispatch(_build_parser(argv[0]).parse_args(argv), client)
+        except SystemExit as e:
+            # argparse errors and the wrappers report failure through sys.exit()
+            if e.code:
+                log.error(f"Command exited with status {e.code}: {' '.join(argv)}")
+        except Exception as e:
+            log.error(f"Command failed: {' '.join(argv)}\n{e}")
+
+
+def _add_create_parser(subparser: argparse._SubParsersAction) -> None:
     # CREATE command
     create = subparser.add_parser("CREATE", help="Creates a project and all constituant parts from configuration files")
     create.add_argument("name", type=str, help="Name of the project, must be a subfolder in the Top directory")
-    create.set_defaults(func=project_creator_wrapper, needs_client=True)
 
+
+def _add_create_platform_parser(subparser: argparse._SubParsersAction) -> None:
     # CREATE_PLATFORM command
     create_p = subparser.add_parser("CREATE_PLATFORM", help="Creates a platform project")
     create_p.add_argument("name", type=str, help="Base name of the platform project. '_platform' will be appended")
-    create_p.set_defaults(func=create_platform_wrapper, needs_client=True)
 
+
+def _add_create_app_parser(subparser: argparse._SubParsersAction) -> None:
     # CREATE_APP command
     create_a = subparser.add_parser("CREATE_APP", help="Creates an application project")
     create_a.add_argument("name", type=str, help="Base name of the application project. '_application' will be appended")
     create_a.add_argument("-p", "--platform", type=str, help="Name of the platform project to reference, specified without the '_platform' suffix")
-    create_a.set_defaults(func=create_application_wrapper, needs_client=True)
 
+
+def _add_activate_parser(subparser: argparse._SubParsersAction) -> None:
     # ACTIVATE command
     activate = subparser.add_parser("ACTIVATE", help="Sets a project as active for IDE tooling (clangd IntelliSense)")
     activate.add_argument("name", type=str, help="Name of the project to activate")
-    activate.set_defaults(func=activate_project_wrapper, needs_client=False)
 
+
+def _add_build_parser(subparser: argparse._SubParsersAction) -> None:
     # BUILD command
     build = subparser.add_parser("BUILD", help="Builds a project using Vitis server or directly with Ninja")
     build.add_argument("name", type=str, help="Name of the application to build, or project name with --all flag")
@@ -127,79 +174,126 @@ def launch_client():
                        help="Use system ninja from PATH instead of Vitis-bundled (requires ninja >=1.5, ninja builds only)")
     build.add_argument("--no-activate", dest="activate", action="store_false", default=True,
                        help="Don't activate the project after building")
-    build.set_defaults(func=build_project_wrapper, needs_client=True)
+    build.add_argument("--parallel", action="store_true",
+                       help="Build the BSPs, and then the applications, concurrently (ninja --all builds only)")
+    build.add_argument("--incremental", action="store_true",
+                       help="Skip applications whose ELF is newer than all of their inputs (ninja --all builds only)")
+
 
+def _add_update_parser(subparser: argparse._SubParsersAction) -> None:
     # UPDATE command
     update = subparser.add_parser("UPDATE", help="Updates an existing project based on config file changes")
     update.add_argument("name", type=str, help="Name of the project to update")
     update.add_argument("--platform", action="store_true", help="Update platform/domains only")
     update.add_argument("--application", action="store_true", help="Update application(s) only")
     update.add_argument("--no-build", action="store_true", dest="no_build", help="Skip rebuild after updating")
-    update.set_defaults(func=update_project_wrapper, needs_client=True)
 
-    args = parser.parse_args()
 
-    # Check if command was provided
-    if not hasattr(args, 'func'):
-        parser.print_help()
-        sys.exit(1)
+def _add_serve_parser(subparser: argparse._SubParsersAction) -> None:
+    # SERVE command
+    subparser.add_parser("SERVE", help="Runs commands read from stdin (one per line) with a single Vitis client")
+
+
+# Subparser builders, keyed by command name. Only the requested command is built
+_COMMAND_PARSERS = {
+    "CREATE": _add_create_parser,
+    "CREATE_PLATFORM": _add_create_platform_parser,
+    "CREATE_APP": _add_create_app_parser,
+    "ACTIVATE": _add_activate_parser,
+    "BUILD": _add_build_parser,
+    "UPDATE": _add_update_parser,
+    "SERVE": _add_serve_parser,
+}
+
+# Command name -> (wrapper, needs Vitis client)
+_DISPATCH = {
+    "CREATE": (project_creator_wrapper, True),
+    "CREATE_PLATFORM": (create_platform_wrapper, True),
+    "CREATE_APP": (create_application_wrapper, True),
+    "ACTIVATE": (activate_project_wrapper, False),
+    "BUILD": (build_project_wrapper, True),
+    "UPDATE": (update_project_wrapper, True),
+    "SERVE": (serve_wrapper, True),
+}
+
+
+def _build_parser(command: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="Vitis Workspace Builder"
+    )
+    subparser = parser.add_subparsers(dest='command', required=True)
+
+    if command in _COMMAND_PARSERS:
+        _COMMAND_PARSERS[command](subparser)
+    else:
+        # Help, missing or unknown command: register everything so argparse can report usage
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(subparser)
+
+    return parser
 
-    needs_client = getattr(args, 'needs_client', True)
+
+def _needs_client(args: argparse.Namespace) -> bool:
+    _, needs_client = _DISPATCH[args.command]
 
     # Special case: BUILD with --tools ninja doesn't need client
     if args.command == 'BUILD' and args.tools == 'ninja':
-        needs_client = False
+        return False
 
-    if needs_client:
-        # Create a Vitis client object
-        log.info("Creating the Vitis client")
-        client = vitis.create_client()
+    return needs_client
 
-        log.info("Creating SDK workspace")
-        create_workspace(client)
 
-        # Call with client for commands that need it
-        if args.command == 'BUILD':
-            args.func(args=args, client=client)
-        else:
-            args.func(client=client, args=args)
-    else:
+def _dispatch(args: argparse.Namespace, client: vitis_client) -> None:  # pyright: ignore[reportInvalidTypeVarUse]
+    func, _ = _DISPATCH[args.command]
+
+    if not _needs_client(args):
         # Commands that don't need Vitis client
         log.info(f"Running {args.command} (no Vitis client required)")
         if args.command == 'BUILD':
-            args.func(args=args, client=None)
+            func(args=args, client=None)
         else:
-            args.func(args=args)
+            func(args=args)
+    elif args.command == 'BUILD':
+        func(args=args, client=client)
+    else:
+        func(client=client, args=args)
+
+
+def launch_client():
+    global _vitis_client_created
+
+    parser = _build_parser(sys.argv[1] if len(sys.argv) > 1 else None)
+    args = parser.parse_args()
+
+    client = None
+    if _needs_client(args):
+        # Create a Vitis client object
+        from vitis_create import create_workspace
+
+        log.info("Creating the Vitis client")
+        client = _get_vitis().create_client()
+        _vitis_client_created = True
+
+        log.info("Creating SDK workspace")
+        create_workspace(client)
+
+    _dispatch(args, client)
 
 
 if __name__ == '__main__':
     cleanupLatestLog()
     log = Logger("launch")
-    _vitis_client_created = False
 
     try:
-        # Check if command needs Vitis client before launching
-        import sys as _sys
-        _args = _sys.argv[1:] if len(_sys.argv) > 1 else []
-        _command = _args[0] if _args else None
-        _needs_vitis = True
-
-        if _command == 'ACTIVATE':
-            _needs_vitis = False
-        elif _command == 'BUILD' and '--tools' in _args:
-            _tools_idx = _args.index('--tools')
-            if _tools_idx + 1 < len(_args) and _args[_tools_idx + 1] == 'ninja':
-                _needs_vitis = False
-
+        # launch_client() records whether it created a Vitis client that needs disposing
         launch_client()
-        _vitis_client_created = _needs_vitis
     except Exception as e:
         log.critical(f"The following error causes the Vitis client to exit:\n{e}")
-        _vitis_client_created = True
-
-    log.info("Finished processing")
-    sys.stdout.flush()
 
     if _vitis_client_created:
-        log.info("Disposing of Vitis client")
-        vitis.dispose()
+        log.debug("Finished processing, disposing of Vitis client")
+        # Only the Vitis client writes to stdout directly, flush it before tearing the client down
+        sys.stdout.flush()
+        _get_vitis().dispose()
+    else:
+        log.debug("Finished processing")
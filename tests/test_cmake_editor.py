@@ -0,0 +1,87 @@
+import configparser
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vitis_application import VitisApplication, _CMakeEditor
+
+
+USERCONFIG = """# header
+set(USER_COMPILE_DEFINITIONS
+)
+set(USER_INCLUDE_DIRECTORIES
+)
+set(USER_COMPILE_OPTIMIZATION_LEVEL -O0)
+set(USER_COMPILE_WARNINGS_ALL -Wall)
+set(USER_COMPILE_OTHER_FLAGS )
+set(USER_LINK_NO_STDLIB )
+set(USER_LINK_LIBRARIES
+)
+"""
+
+APPLICATION_CONF = """
+[compiler]
+compile_definitions = DEBUG, FOO=1
+include_directories = /opt/inc, /opt/other
+optimization_level = 2
+warnings_all = false
+other_flags = -DX
+
+[linker]
+no_stdlib = true
+libraries = m, c
+"""
+
+
+class CMakeEditorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "UserConfig.cmake")
+        with open(self.path, 'w') as f:
+            f.write(USERCONFIG)
+
+        config = configparser.ConfigParser()
+        config.read_string(APPLICATION_CONF)
+        self.app = VitisApplication.__new__(VitisApplication)
+        self.app._VitisApplication__config = config
+        self.app._VitisApplication__project_src_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def configure(self):
+        with _CMakeEditor(self.path) as editor:
+            self.app._VitisApplication__configure_compiler(editor)
+            self.app._VitisApplication__configure_linker(editor)
+
+    def test_second_identical_configure_leaves_file_untouched(self):
+        self.configure()
+        with open(self.path) as f:
+            first = f.read()
+        mtime = os.stat(self.path).st_mtime_ns
+
+        time.sleep(0.05)
+        self.configure()
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), first)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+
+    def test_values_replace_the_old_separator(self):
+        self.configure()
+        with open(self.path) as f:
+            content = f.read()
+
+        self.assertIn('set(USER_COMPILE_DEFINITIONS\n"DEBUG"\n"FOO=1"\n)', content)
+        self.assertIn('set(USER_COMPILE_OPTIMIZATION_LEVEL -O2)', content)
+        self.assertIn('set(USER_COMPILE_WARNINGS_ALL )', content)
+        self.assertIn('set(USER_LINK_LIBRARIES\n"m"\n"c"\n)', content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,22 +1,29 @@
-import argparse
 import configparser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import io
 import json
 import os
-from pathlib import Path
 import platform
 import re
 import shutil
-import sys
+import stat
+import subprocess
 from typing import List, TypeVar, Dict, Any
 
 # Add package: Vitis Python CLI
 # import vitis # type: ignore
 vitis_client = TypeVar('vitis_client')
 
+# Optional: faster JSON for launch.json, not shipped with Vitis' Python
+try:
+    import orjson # type: ignore
+except ImportError:
+    orjson = None
+
 from vitis_logging import Logger
 from vitis_paths import (
-    read_config, parentdir, PROJECTS_PATH, HDL_DATA_PATH,
-    get_vitis_install_dir, get_workspace_root, get_src_root, normalize_path
+    read_config, get_vitis_install_dir, get_workspace_root, get_src_root, normalize_path
 )
 
 
@@ -24,28 +31,155 @@ log = Logger("application")
 
 TEMPLATES_PATH = os.path.join(os.path.dirname(__file__), "templates")
 
+# Paths referencing CMake/Xilinx variables are left for CMake to evaluate
+_CMAKE_VAR_LITERAL_RE = re.compile(r'\$\{(CMAKE_|XILINX_)')
+_LAUNCH_SECTION_RE = re.compile(r"launch_\d+")
+_TEMPLATE_RE = re.compile(r"\{\{(\w+)\}\}")
+_BARE_PLACEHOLDER_RE = re.compile(r'(?<!")(\{\{\w+\}\})(?!")')
+_NEWLINE_TO_COMMA = str.maketrans('\n', ',')
+
+# Source file extensions picked up from source folders
+_SOURCE_EXTS = ('.c', '.S')
+
+# Written next to the common source parent so clangd accepts the cross-compiler flags
+_CLANGD_CONTENT = b"""CompileFlags:
+    Add: [-Wno-unknown-warning-option, -U__linux__, -U__clang__]
+    Remove: [-m*, -f*]
+"""
 
-def _edit_cmake_variable(file_path: str, variable_name: str, new_value: str) -> None:
+# Vitis' generated CMakeLists.txt only scans the top of src/, swapped for a recursive glob
+_AUX_SOURCE_RE = re.compile(r'aux_source_directory\(\$\{CMAKE_SOURCE_DIR\}\s+_sources\)')
+_GLOB_SOURCES = '''file(GLOB_RECURSE _sources
+    FOLLOW_SYMLINKS
+    ${CMAKE_SOURCE_DIR}/*.c
+    ${CMAKE_SOURCE_DIR}/*.S
+)'''
+
+# Symlink/copy creation is syscall bound, threads overlap the waits
+_SYMLINK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@lru_cache(maxsize=128)
+def _cmake_variable_pattern(variable_names: tuple) -> "re.Pattern":
+    """
+    Compiled pattern matching set(VARIABLE_NAME value) for any of the given names in UserConfig.cmake.
+    Handles both single line and multi-line values ([^)] also matches newlines).
+    Anchored to the start of a line (indentation allowed) so candidate matches are only tried
+    where a set() can begin. [^)]* cannot backtrack into the closing paren, so a failed
+    candidate costs at most one scan to the next ')'.
+    The whitespace after the name belongs to the value group, so a rewrite replaces it
+    instead of piling a new separator on top of the old one.
     """
-    Edit a CMake variable in UserConfig.cmake.
+    names = '|'.join(re.escape(name) for name in variable_names)
+    return re.compile(rf'^([ \t]*set\(({names}))(\s[^)]*)\)', re.MULTILINE)
 
-    Args:
-        file_path: Path to UserConfig.cmake
-        variable_name: Variable name (e.g., 'USER_COMPILE_OPTIMIZATION_LEVEL')
-        new_value: New value to set
+
+def _write_file_atomic(file_path: str, content: str) -> None:
+    """
+    Write a text file through a temporary sibling and os.replace, so readers
+    (CMake, the Vitis IDE) never see a half-written file.
+    Falls back to writing in place if the file cannot be replaced (e.g. locked on Windows).
+    """
+    tmp_path = f"{file_path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+
+        # os.replace would otherwise leave the file with the umask default mode
+        try:
+            shutil.copymode(file_path, tmp_path)
+        except FileNotFoundError:
+            pass
+    except BaseException:
+        # Don't leave a partial temporary file next to the original (e.g. disk full)
+        _force_unlink(tmp_path)
+        raise
+
+    try:
+        os.replace(tmp_path, file_path)
+    except OSError as e:
+        log.debug(f"Atomic replace of {file_path} failed ({e}), writing in place")
+        _force_unlink(tmp_path)
+        with open(file_path, 'w') as f:
+            f.write(content)
+
+
+def _write_clangd(clangd_path: str) -> bool:
     """
-    with open(file_path, 'r') as f:
-        content = f.read()
+    Write the shared .clangd, unless it already has exactly this content. Rewriting an
+    identical file would still touch its mtime and make clangd reload.
 
-    # Pattern to match: set(VARIABLE_NAME value)
-    # Handles both single line and multi-line values
-    pattern = rf'(set\({variable_name}\s+)([^\)]*)\)'
+    Returns:
+        True if the file was written, False if it was already up to date
 
-    replacement = rf'\g<1>{new_value})'
-    new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE | re.DOTALL)
+    Raises:
+        OSError: If the file could not be written
+    """
+    try:
+        with open(clangd_path, 'rb') as f:
+            if f.read() == _CLANGD_CONTENT:
+                return False
+    except OSError:
+        pass
 
-    with open(file_path, 'w') as f:
-        f.write(new_content)
+    with open(clangd_path, 'wb') as f:
+        f.write(_CLANGD_CONTENT)
+    return True
+
+
+class _CMakeEditor(object):
+    """
+    Batches edits to UserConfig.cmake: the file is read once on enter, and all
+    pending set() values are substituted in a single pass and written once on exit.
+    """
+
+    def __init__(self, file_path: str):
+        self.__file_path = file_path
+        self.__edits: Dict[str, str] = {}
+        self.content = ""
+
+    def __enter__(self) -> "_CMakeEditor":
+        with open(self.__file_path, 'r') as f:
+            self.content = f.read()
+        return self
+
+    def set(self, variable_name: str, new_value: str) -> None:
+        """
+        Queue a new value for a CMake variable.
+
+        Args:
+            variable_name: Variable name (e.g., 'USER_COMPILE_OPTIMIZATION_LEVEL')
+            new_value: New value to set
+        """
+        self.__edits[variable_name] = new_value
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None or not self.__edits:
+            return
+
+        # One scan over the file: copy untouched spans verbatim, rewrite matched set() calls
+        pattern = _cmake_variable_pattern(tuple(sorted(self.__edits)))
+        out = io.StringIO()
+        last = 0
+        for m in pattern.finditer(self.content):
+            value = self.__edits[m.group(2)]
+            out.write(self.content[last:m.start()])
+            out.write(m.group(1))
+            # Multi-line values bring their own leading newline, others need a separator
+            out.write(value if value[:1].isspace() else f" {value}")
+            out.write(")")
+            last = m.end()
+        out.write(self.content[last:])
+        new_content = out.getvalue()
+
+        # Leave the file (and its mtime) alone when every value was already set,
+        # so CMake and clangd are not triggered by a no-op configure
+        if new_content == self.content:
+            log.debug(f"{os.path.basename(self.__file_path)} is already up to date")
+            return
+
+        self.content = new_content
+        _write_file_atomic(self.__file_path, self.content)
 
 
 def _parse_multiline_paths(config_value: str) -> List[str]:
@@ -59,14 +193,23 @@ def _parse_multiline_paths(config_value: str) -> List[str]:
     Returns:
         List of cleaned, non-empty path strings
     """
-    paths = [p.strip() for p in config_value.replace('\n', ',').split(',') if p.strip()]
-    return paths
+    return [p for p in map(str.strip, config_value.translate(_NEWLINE_TO_COMMA).split(',')) if p]
 
 
+def _quoted_csv(config_value: str) -> str:
+    """
+    Turn a comma-separated config value into one quoted CMake list item per line.
+    Empty items (e.g. from a trailing comma) are dropped.
+    """
+    return '\n'.join(f'"{p}"' for p in map(str.strip, config_value.split(',')) if p)
+
+
+@lru_cache(maxsize=1024)
 def _expand_path_variables(path: str) -> str:
     """
     Expand custom variables in path string.
     CMake variables (like ${CMAKE_SOURCE_DIR}) are kept literal for CMake evaluation.
+    Results are cached, the roots substituted below do not change while the CLI runs.
 
     Supported custom variables:
     - ${VITIS_INSTALL_DIR} -> Vitis installation root
@@ -81,8 +224,7 @@ def _expand_path_variables(path: str) -> str:
     """
     expanded = path
 
-    cmake_var_pattern = r'\$\{(CMAKE_|XILINX_)'
-    if re.search(cmake_var_pattern, path):
+    if _CMAKE_VAR_LITERAL_RE.search(path):
         return normalize_path(path)
 
     if '${VITIS_INSTALL_DIR}' in expanded:
@@ -97,23 +239,28 @@ def _expand_path_variables(path: str) -> str:
     return normalize_path(expanded)
 
 
-def _create_symlink(src_path: str, link_path: str) -> bool:
+def _create_symlink(src_path: str, link_path: str, src_verified: bool = False) -> bool:
     """
-    Create a symbolic link, with fallback to copy on Windows if permissions insufficient.
+    Create a symbolic link, with fallback to a hard link or copy on Windows if permissions insufficient.
 
     Args:
         src_path: Source file path (must exist)
         link_path: Symlink path to create
+        src_verified: Caller has already confirmed src_path exists, skip the check
 
     Returns:
-        True if symlink/copy created successfully, False otherwise
+        True if symlink/hard link/copy created successfully, False otherwise
     """
     try:
-        if os.path.exists(link_path) or os.path.islink(link_path):
+        # A single lstat covers both existing files and (possibly dangling) symlinks
+        try:
+            os.lstat(link_path)
             log.debug(f"Symlink already exists: {link_path}")
             return True
+        except FileNotFoundError:
+            pass
 
-        if not os.path.exists(src_path):
+        if not src_verified and not os.path.exists(src_path):
             log.warning(f"Source file does not exist: {src_path}")
             return False
 
@@ -124,7 +271,15 @@ def _create_symlink(src_path: str, link_path: str) -> bool:
                 log.info(f"Created symlink: {os.path.basename(link_path)} -> {src_path}")
                 return True
             except OSError:
-                # Fallback to copy if symlink fails (permission issues)
+                pass
+
+            try:
+                # NTFS hard links need no special privileges and share the source's data
+                os.link(src_path, link_path)
+                log.info(f"Created hard link (symlink failed): {os.path.basename(link_path)} -> {src_path}")
+                return True
+            except OSError:
+                # Fallback to copy if the source is on another volume or filesystem
                 shutil.copy2(src_path, link_path)
                 log.info(f"Created copy (symlink failed): {os.path.basename(link_path)} -> {src_path}")
                 return True
@@ -133,18 +288,209 @@ def _create_symlink(src_path: str, link_path: str) -> bool:
             log.info(f"Created symlink: {os.path.basename(link_path)} -> {src_path}")
             return True
 
+    except FileExistsError:
+        # Created by someone else since the probe above
+        log.debug(f"Symlink already exists: {link_path}")
+        return True
     except Exception as e:
         log.warning(f"Failed to create symlink {link_path}: {e}")
         return False
 
 
-def _find_source_files_recursively(folder: str, extensions: List[str] = ['.c', '.S']) -> List[str]:
+def _scan_source_files(folder: str, extensions: tuple = _SOURCE_EXTS):
+    """
+    Yield os.DirEntry objects for files under folder, recursively, whose name ends with one of the extensions.
+    Uses os.scandir directly so directory entries are classified without extra stat calls.
+    Symlinked directories are not followed, matching os.walk defaults.
+    """
+    stack = [folder]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(extensions) and entry.is_file():
+                    yield entry
+
+
+def _force_unlink(path: str) -> bool:
+    """
+    Remove a file or symlink (dangling or not) if it exists, with a single syscall.
+
+    Returns:
+        True if something was removed, False if nothing was there
+    """
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _atomic_symlink(target: str, link_path: str) -> bool:
+    """
+    Point link_path at target, replacing any existing file or symlink with a single rename
+    so the path is never missing in between.
+
+    Returns:
+        True if the symlink is in place, False if symlinks are unavailable (caller falls back)
+    """
+    tmp_path = f"{link_path}.tmp.{os.getpid()}"
+    try:
+        os.symlink(target, tmp_path)
+    except (OSError, NotImplementedError):
+        return False
+
+    try:
+        os.replace(tmp_path, link_path)
+        return True
+    except OSError:
+        _force_unlink(tmp_path)
+        return False
+
+
+def _atomic_link_or_copy(src_path: str, dest_path: str) -> bool:
+    """
+    Replace dest_path with a hard link to src_path, or a copy where hard links are not
+    possible (another volume), staged under a temporary name and swapped in with os.replace.
+
+    Returns:
+        True if a hard link was created, False if the file was copied
+
+    Raises:
+        OSError: If neither a hard link nor a copy could be put in place
+    """
+    tmp_path = f"{dest_path}.tmp.{os.getpid()}"
+    try:
+        os.link(src_path, tmp_path)
+        hardlinked = True
+    except OSError:
+        shutil.copy2(src_path, tmp_path)
+        hardlinked = False
+
+    try:
+        os.replace(tmp_path, dest_path)
+    except OSError:
+        _force_unlink(tmp_path)
+        raise
+    return hardlinked
+
+
+def _replace_symlink(src_path: str, link_path: str) -> bool:
+    """
+    Symlink link_path to src_path, replacing whatever is there. Falls back to
+    _create_symlink (hard link or copy on Windows) if symlinks are unavailable.
+
+    Returns:
+        True if the link/copy is in place, False otherwise
+    """
+    if not os.path.exists(src_path):
+        log.warning(f"Source file does not exist: {src_path}")
+        return False
+
+    if _atomic_symlink(src_path, link_path):
+        log.info(f"Created symlink: {os.path.basename(link_path)} -> {src_path}")
+        return True
+
+    try:
+        _force_unlink(link_path)
+    except OSError as e:
+        log.warning(f"Failed to remove existing {link_path}: {e}")
+        return False
+
+    return _create_symlink(src_path, link_path, src_verified=True)
+
+
+def _common_parent(paths: List[str]) -> str:
+    """
+    Longest common directory of absolute paths, like os.path.commonpath.
+    Walks up from the shortest path with plain prefix checks instead of splitting every path,
+    which suits the usual case of paths sharing one workspace root.
+
+    Raises:
+        ValueError: If paths is empty or the paths share no common root
+    """
+    paths = [os.path.normpath(p) for p in paths]
+    if not paths:
+        raise ValueError("_common_parent() arg is an empty sequence")
+
+    # Compare case-folded on Windows, return the original spelling
+    keys = [os.path.normcase(p) for p in paths]
+    shortest = min(range(len(paths)), key=lambda i: len(paths[i]))
+    candidate, candidate_key = paths[shortest], keys[shortest]
+
+    while True:
+        prefix = candidate_key if candidate_key.endswith(os.sep) else candidate_key + os.sep
+        if all(k == candidate_key or k.startswith(prefix) for k in keys):
+            return candidate
+
+        parent = os.path.dirname(candidate)
+        if parent == candidate:
+            break
+        candidate, candidate_key = parent, os.path.dirname(candidate_key)
+
+    # Different drives, or a mix of absolute and relative paths
+    return os.path.commonpath(paths)
+
+
+def _create_symlinks(pairs: List[tuple], src_verified: bool = False) -> int:
+    """
+    Create many symlinks concurrently. Every pair must have a distinct link path.
+
+    Args:
+        pairs: List of (src_path, link_path) tuples
+        src_verified: Caller has already confirmed every src_path exists
+
+    Returns:
+        Number of symlinks/copies created or already present
+    """
+    if len(pairs) < 2:
+        return sum(_create_symlink(src, link, src_verified=src_verified) for src, link in pairs)
+
+    with ThreadPoolExecutor(max_workers=min(_SYMLINK_WORKERS, len(pairs))) as executor:
+        results = executor.map(lambda pair: _create_symlink(pair[0], pair[1], src_verified=src_verified), pairs)
+        return sum(results)
+
+
+def _create_junction(src_folder: str, link_path: str) -> bool:
+    """
+    Create an NTFS directory junction (Windows only).
+    Junctions need no admin rights or developer mode and behave like a folder symlink for reads.
+
+    Args:
+        src_folder: Source directory path (absolute)
+        link_path: Junction path to create
+
+    Returns:
+        True if the junction was created, False otherwise
+    """
+    if platform.system() != 'Windows':
+        return False
+
+    try:
+        result = subprocess.run(
+            ["cmd", "/c", "mklink", "/J", os.path.abspath(link_path), os.path.abspath(src_folder)],
+            capture_output=True,
+            text=True
+        )
+    except OSError as e:
+        log.debug(f"Directory junction failed: {e}")
+        return False
+
+    if result.returncode != 0:
+        log.debug(f"Directory junction failed: {result.stderr.strip() or result.stdout.strip()}")
+        return False
+
+    return True
+
+
+def _find_source_files_recursively(folder: str, extensions: tuple = _SOURCE_EXTS) -> List[str]:
     """
     Recursively find source files in folder with given extensions.
 
     Args:
         folder: Directory to search recursively
-        extensions: List of file extensions to include (default: ['.c', '.S'])
+        extensions: Tuple of file extensions to include (default: ('.c', '.S'))
 
     Returns:
         List of absolute file paths matching the extensions
@@ -159,27 +505,25 @@ def _find_source_files_recursively(folder: str, extensions: List[str] = ['.c', '
         log.warning(f"Path is not a directory: {folder}")
         return source_files
 
-    for root, dirs, files in os.walk(folder):
-        for file in files:
-            if any(file.endswith(ext) for ext in extensions):
-                source_files.append(os.path.join(root, file))
+    source_files.extend(entry.path for entry in _scan_source_files(folder, tuple(extensions)))
 
     log.debug(f"Found {len(source_files)} source files in {folder}")
     return source_files
 
 
-def _create_folder_symlink(src_folder: str, link_name: str, project_src_dir: str) -> bool:
+def _create_folder_symlink(src_folder: str, link_name: str, project_src_dir: str, src_verified: bool = False) -> bool:
     """
     Create folder symlink with fallback to directory recreation.
 
     Tries to create a folder symlink first (preserves directory structure).
-    If that fails (Windows permissions), falls back to recreating the directory
-    structure with individual file symlinks.
+    If that fails (Windows permissions), tries a directory junction, then falls
+    back to recreating the directory structure with individual file symlinks.
 
     Args:
         src_folder: Source directory path (absolute)
         link_name: Name for the symlinked folder in project (basename only)
         project_src_dir: Project's src/ directory where symlink will be created
+        src_verified: Caller has already confirmed src_folder is an existing directory
 
     Returns:
         True if successful, False otherwise
@@ -187,17 +531,23 @@ def _create_folder_symlink(src_folder: str, link_name: str, project_src_dir: str
     try:
         link_path = os.path.join(project_src_dir, link_name)
 
-        if os.path.exists(link_path) or os.path.islink(link_path):
+        try:
+            os.lstat(link_path)
             log.debug(f"Folder symlink already exists: {link_path}")
             return True
+        except FileNotFoundError:
+            pass
 
-        if not os.path.exists(src_folder):
-            log.warning(f"Source folder does not exist: {src_folder}")
-            return False
+        if not src_verified:
+            try:
+                src_mode = os.stat(src_folder).st_mode
+            except FileNotFoundError:
+                log.warning(f"Source folder does not exist: {src_folder}")
+                return False
 
-        if not os.path.isdir(src_folder):
-            log.warning(f"Source path is not a directory: {src_folder}")
-            return False
+            if not stat.S_ISDIR(src_mode):
+                log.warning(f"Source path is not a directory: {src_folder}")
+                return False
 
         try:
             os.symlink(src_folder, link_path, target_is_directory=True)
@@ -205,27 +555,30 @@ def _create_folder_symlink(src_folder: str, link_name: str, project_src_dir: str
             return True
 
         except OSError as symlink_error:
+            if _create_junction(src_folder, link_path):
+                log.info(f"Created folder junction: {link_name}/ -> {src_folder}")
+                return True
+
             log.debug(f"Folder symlink failed ({symlink_error}), recreating directory structure")
 
             os.makedirs(link_path, exist_ok=True)
 
-            file_count = 0
-            for root, dirs, files in os.walk(src_folder):
-                rel_path = os.path.relpath(root, src_folder)
-
-                if rel_path == '.':
-                    dest_dir = link_path
-                else:
-                    dest_dir = os.path.join(link_path, rel_path)
-                    os.makedirs(dest_dir, exist_ok=True)
+            # Directories are created while walking, file links are created together afterwards
+            file_pairs = []
+            stack = [(src_folder, link_path)]
+            while stack:
+                src_dir, dest_dir = stack.pop()
+                with os.scandir(src_dir) as it:
+                    for entry in it:
+                        dest_entry = dest_dir + os.sep + entry.name
 
-                for file in files:
-                    if file.endswith(('.c', '.S')):
-                        src_file = os.path.join(root, file)
-                        dest_file = os.path.join(dest_dir, file)
+                        if entry.is_dir(follow_symlinks=False):
+                            os.makedirs(dest_entry, exist_ok=True)
+                            stack.append((entry.path, dest_entry))
+                        elif entry.name.endswith(_SOURCE_EXTS) and entry.is_file():
+                            file_pairs.append((entry.path, dest_entry))
 
-                        if _create_symlink(src_file, dest_file):
-                            file_count += 1
+            file_count = _create_symlinks(file_pairs, src_verified=True)
 
             log.info(f"Created directory structure for {link_name}/ with {file_count} file symlinks")
             return True
@@ -235,6 +588,29 @@ def _create_folder_symlink(src_folder: str, link_name: str, project_src_dir: str
         return False
 
 
+def _parse_bool(value: str) -> bool:
+    """
+    Parse a config boolean the same way ConfigParser.getboolean does, on an already-read value.
+
+    Raises:
+        ValueError: If value is not a recognised boolean
+    """
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
+
+
+def _section_dict(config: configparser.ConfigParser, section: str) -> Dict[str, str]:
+    """Snapshot a config section into a plain dict (empty if the section is missing)."""
+    return dict(config[section]) if config.has_section(section) else {}
+
+
+def _section_bool(section: Dict[str, str], option: str, fallback: bool) -> bool:
+    """Boolean option from a section snapshot, or fallback if it is not set."""
+    return _parse_bool(section[option]) if option in section else fallback
+
+
 def _bool_to_cmake_flag(enabled: bool, flag: str) -> str:
     """Convert boolean to CMake flag or empty string."""
     return flag if enabled else ""
@@ -296,27 +672,99 @@ def _format_debug_level(level: str) -> str:
         return f"-g{level}"
 
 
-def _render_template(template_path: str, context: Dict[str, Any]) -> str:
+# [compiler] option -> (UserConfig.cmake variable, formatter or None for verbatim)
+_COMPILER_SCALAR_TABLE = (
+    ("optimization_level", "USER_COMPILE_OPTIMIZATION_LEVEL", _format_optimization_level),
+    ("optimization_other_flags", "USER_COMPILE_OPTIMIZATION_OTHER_FLAGS", None),
+    ("debug_level", "USER_COMPILE_DEBUG_LEVEL", _format_debug_level),
+    ("debug_other_flags", "USER_COMPILE_DEBUG_OTHER_FLAGS", None),
+    ("other_flags", "USER_COMPILE_OTHER_FLAGS", None),
+)
+
+# [compiler] boolean option -> (UserConfig.cmake variable, flag when enabled)
+_COMPILER_FLAG_TABLE = (
+    ("warnings_all", "USER_COMPILE_WARNINGS_ALL", "-Wall"),
+    ("warnings_extra", "USER_COMPILE_WARNINGS_EXTRA", "-Wextra"),
+    ("warnings_as_errors", "USER_COMPILE_WARNINGS_AS_ERRORS", "-Werror"),
+    ("warnings_check_syntax_only", "USER_COMPILE_WARNINGS_CHECK_SYNTAX_ONLY", "-fsyntax-only"),
+    ("warnings_pedantic", "USER_COMPILE_WARNINGS_PEDANTIC", "-pedantic"),
+    ("warnings_pedantic_as_errors", "USER_COMPILE_WARNINGS_PEDANTIC_AS_ERRORS", "-pedantic-errors"),
+    ("warnings_inhibit_all", "USER_COMPILE_WARNINGS_INHIBIT_ALL", "-w"),
+    ("verbose", "USER_COMPILE_VERBOSE", "-v"),
+    ("ansi", "USER_COMPILE_ANSI", "-ansi"),
+)
+
+# [linker] boolean option -> (UserConfig.cmake variable, flag when enabled)
+_LINKER_FLAG_TABLE = (
+    ("no_start_files", "USER_LINK_NO_START_FILES", "-nostartfiles"),
+    ("no_default_libs", "USER_LINK_NO_DEFAULT_LIBS", "-nodefaultlibs"),
+    ("no_stdlib", "USER_LINK_NO_STDLIB", "-nostdlib"),
+    ("omit_all_symbol_info", "USER_LINK_OMIT_ALL_SYMBOL_INFO", "-s"),
+)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON (bytes or str) with orjson when available, the standard library otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize JSON to UTF-8 bytes with 2-space indentation, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Match orjson's output: non-ASCII written as-is
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _read_template(template_path: str) -> str:
+    """Read a template file once, templates do not change while the CLI runs."""
+    with open(template_path, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _load_json_template(template_path: str) -> Any:
     """
-    Render a template file with {{placeholder}} replacements.
+    Parse a JSON template with {{placeholder}} values once.
+    Bare placeholders (booleans) are quoted first so the template is valid JSON.
+    The result is shared, callers must not modify it.
+    """
+    return _json_loads(_BARE_PLACEHOLDER_RE.sub(r'"\1"', _read_template(template_path)))
+
+
+def _fill_json_template(node: Any, context: Dict[str, Any]) -> Any:
+    """
+    Build a copy of a parsed JSON template with {{placeholder}} values filled in.
+    A string that is a single placeholder takes the context value as-is (keeping booleans),
+    placeholders embedded in longer strings are substituted as text.
 
     Args:
-        template_path: Path to template file
+        node: Parsed template (or part of it)
         context: Dictionary of placeholder -> value mappings
 
     Returns:
-        Rendered content
+        Filled copy of node
     """
-    with open(template_path, 'r') as f:
-        content = f.read()
+    if isinstance(node, dict):
+        return {key: _fill_json_template(value, context) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_fill_json_template(value, context) for value in node]
+    if isinstance(node, str):
+        m = _TEMPLATE_RE.fullmatch(node)
+        if m and m.group(1) in context:
+            return context[m.group(1)]
 
-    for key, value in context.items():
-        placeholder = f"{{{{{key}}}}}"
-        if isinstance(value, bool):
-            value = str(value).lower()
-        content = content.replace(placeholder, str(value))
+        def _text(m):
+            if m.group(1) not in context:
+                return m.group(0)
+            value = context[m.group(1)]
+            return str(value).lower() if isinstance(value, bool) else str(value)
 
-    return content
+        return _TEMPLATE_RE.sub(_text, node)
+    return node
 
 
 class VitisDebugConfig(object):
@@ -341,37 +789,47 @@ class VitisDebugConfig(object):
         """
         log.info(f"Generating launch configuration: {self.__name}")
 
-        config_name = self.__config.get("launch", "name", fallback=f"{self.__app_name}_{self.__name}")
-        debug_type = self.__config.get("launch", "debug_type", fallback="baremetal-zynq")
-        target_core = self.__config.get("target", "core", fallback="ps7_cortexa9_0")
-        context = self.__config.get("target", "context", fallback="zynq")
+        # Snapshot each section once, lookups below are plain dict hits
+        launch = _section_dict(self.__config, "launch")
+        target = _section_dict(self.__config, "target")
+        hardware = _section_dict(self.__config, "hardware")
+        behavior = _section_dict(self.__config, "behavior")
+
+        config_name = launch.get("name", f"{self.__app_name}_{self.__name}")
+        debug_type = launch.get("debug_type", "baremetal-zynq")
+        target_core = target.get("core", "ps7_cortexa9_0")
+        context = target.get("context", "zynq")
 
-        bitstream = self.__config.get("hardware", "bitstream", fallback="")
+        bitstream = hardware.get("bitstream", "")
         if not bitstream:
             # Auto-detect: ${workspace}/${app_name}/_ide/bitstream/*.bit
             bitstream_dir = os.path.join(self.__workspace_path, self.__app_name, "_ide", "bitstream")
-            if os.path.exists(bitstream_dir):
-                bit_files = [f for f in os.listdir(bitstream_dir) if f.endswith('.bit')]
-                if bit_files:
-                    bitstream = f"${{workspaceFolder}}/{self.__app_name}/_ide/bitstream/{bit_files[0]}"
-
-        fsbl = self.__config.get("hardware", "fsbl", fallback="")
+            # Stop at the first .bit file instead of listing the whole directory
+            try:
+                with os.scandir(bitstream_dir) as it:
+                    bit_file = next((e.name for e in it if e.name.endswith('.bit') and e.is_file()), None)
+            except (FileNotFoundError, NotADirectoryError):
+                bit_file = None
+            if bit_file:
+                bitstream = f"${{workspaceFolder}}/{self.__app_name}/_ide/bitstream/{bit_file}"
+
+        fsbl = hardware.get("fsbl", "")
         if not fsbl:
             # Auto-detect: ${workspace}/${platform}/export/${platform}/sw/boot/fsbl.elf
             fsbl = f"${{workspaceFolder}}/{self.__platform_name}_platform/export/{self.__platform_name}_platform/sw/boot/fsbl.elf"
 
-        ps_init_tcl = self.__config.get("hardware", "ps_init_tcl", fallback="")
+        ps_init_tcl = hardware.get("ps_init_tcl", "")
         if not ps_init_tcl:
             # Auto-detect: ${workspace}/${app_name}/_ide/psinit/ps7_init.tcl
             ps_init_tcl = f"${{workspaceFolder}}/{self.__app_name}/_ide/psinit/ps7_init.tcl"
 
         elf_file = f"${{workspaceFolder}}/{self.__app_name}/build/{self.__app_name}.elf"
 
-        reset_system = self.__config.getboolean("behavior", "reset_system", fallback=True)
-        program_device = self.__config.getboolean("behavior", "program_device", fallback=True)
-        reset_apu = self.__config.getboolean("behavior", "reset_apu", fallback=False)
-        stop_at_entry = self.__config.getboolean("behavior", "stop_at_entry", fallback=False)
-        reset_processor = self.__config.getboolean("behavior", "reset_processor", fallback=True)
+        reset_system = _section_bool(behavior, "reset_system", fallback=True)
+        program_device = _section_bool(behavior, "program_device", fallback=True)
+        reset_apu = _section_bool(behavior, "reset_apu", fallback=False)
+        stop_at_entry = _section_bool(behavior, "stop_at_entry", fallback=False)
+        reset_processor = _section_bool(behavior, "reset_processor", fallback=True)
 
         context = {
             "config_name": config_name,
@@ -389,11 +847,10 @@ class VitisDebugConfig(object):
             "stop_at_entry": stop_at_entry,
         }
 
+        # The template is parsed once, each config only fills in a copy of it
         template_path = os.path.join(TEMPLATES_PATH, "launch.json.template")
-        rendered = _render_template(template_path, context)
-
-        template_data = json.loads(rendered)
-        return template_data["configurations"][0]
+        template_data = _load_json_template(template_path)
+        return _fill_json_template(template_data["configurations"][0], context)
 
 
 class VitisApplication(object):
@@ -408,6 +865,8 @@ class VitisApplication(object):
         self.__config_folder = config_folder
         self.__config = read_config(config_folder, config)
         self.__workspace_path = workspace_path
+        self.__project_src_dir = os.path.join(workspace_path, name, "src")
+        self.__userconfig_path = os.path.join(self.__project_src_dir, "UserConfig.cmake")
         self.__application = None
         self.__launch_configs: List[VitisDebugConfig] = []
 
@@ -423,8 +882,9 @@ class VitisApplication(object):
             )
 
         # Add all additional launch configs ([launch_1], [launch_2], etc.)
-        additional_launches = [s for s in self.__config.sections() if re.match(r"launch_\d+", s)]
-        for section in sorted(additional_launches):
+        # Sorted by index so [launch_10] comes after [launch_2]
+        additional_launches = [s for s in self.__config.sections() if _LAUNCH_SECTION_RE.fullmatch(s)]
+        for section in sorted(additional_launches, key=lambda s: int(s.split('_', 1)[1])):
             self.__add_launch_config(
                 self.__config.get(section, "NAME"),
                 self.__config.get(section, "DISPLAY_NAME"),
@@ -487,121 +947,71 @@ class VitisApplication(object):
         """Configure the application's UserConfig.cmake and launch.json."""
         log.info(f"Configuring application {self.__name}")
 
-        self.__configure_compiler()
-        self.__configure_sources()
-        self.__configure_cmake()
-        self.__configure_linker()
-        self.__configure_launch()
+        # Checked once here; it lives in src/, so this also confirms the project src directory
+        has_userconfig = os.path.exists(self.__userconfig_path)
+        if not has_userconfig:
+            log.warning(f"UserConfig.cmake not found at {self.__userconfig_path}, skipping compiler, source and linker configuration")
 
-    def __configure_compiler(self) -> None:
-        """Configure compiler settings in UserConfig.cmake."""
+        # CMakeLists.txt, launch.json and the source links are mostly I/O, run them alongside
+        # the UserConfig.cmake edits, which stay on this thread. The linker step also writes
+        # src/, but only the lscript.ld link, never one of the source links
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            steps = [pool.submit(self.__configure_cmake), pool.submit(self.__configure_launch)]
+            try:
+                if has_userconfig:
+                    steps.append(pool.submit(self.__configure_sources))
+                    # Compiler and linker share one read/write of UserConfig.cmake
+                    with _CMakeEditor(self.__userconfig_path) as editor:
+                        self.__configure_compiler(editor)
+                        self.__configure_linker(editor)
+            finally:
+                # Wait for every worker even if the edits above failed, so no failure goes unreported
+                failures = [e for e in (step.exception() for step in steps) if e is not None]
+                for e in failures:
+                    log.error(f"Configuring application {self.__name} failed: {e}")
+
+            # Re-raise the first failure from a worker
+            if failures:
+                raise failures[0]
+
+    def __configure_compiler(self, editor: _CMakeEditor) -> None:
+        """Configure compiler settings in UserConfig.cmake, queued on the caller's editor."""
         log.debug("Configuring compiler settings")
 
-        userconfig_path = os.path.join(
-            self.__workspace_path,
-            self.__name,
-            "src",
-            "UserConfig.cmake"
-        )
-
-        if not os.path.exists(userconfig_path):
-            log.warning(f"UserConfig.cmake not found at {userconfig_path}, skipping compiler configuration")
-            return
+        # Snapshot the section once, option lookups below are plain dict hits
+        compiler = _section_dict(self.__config, "compiler")
 
         # Symbols
-        if self.__config.has_option("compiler", "compile_definitions"):
-            defined = self.__config.get("compiler", "compile_definitions").strip()
+        if "compile_definitions" in compiler:
+            defined = compiler["compile_definitions"].strip()
             if defined:
-                symbols = [s.strip() for s in defined.split(',')]
-                value = '\n'.join(f'"{s}"' for s in symbols)
-                _edit_cmake_variable(userconfig_path, "USER_COMPILE_DEFINITIONS", f"\n{value}\n")
+                value = _quoted_csv(defined)
+                editor.set("USER_COMPILE_DEFINITIONS", f"\n{value}\n")
 
-        if self.__config.has_option("compiler", "undefined_symbols"):
-            undefined = self.__config.get("compiler", "undefined_symbols").strip()
+        if "undefined_symbols" in compiler:
+            undefined = compiler["undefined_symbols"].strip()
             if undefined:
-                symbols = [s.strip() for s in undefined.split(',')]
-                value = '\n'.join(f'"{s}"' for s in symbols)
-                _edit_cmake_variable(userconfig_path, "USER_UNDEFINED_SYMBOLS", f"\n{value}\n")
+                value = _quoted_csv(undefined)
+                editor.set("USER_UNDEFINED_SYMBOLS", f"\n{value}\n")
 
         # Directories
-        if self.__config.has_option("compiler", "include_directories"):
-            includes = self.__config.get("compiler", "include_directories").strip()
+        if "include_directories" in compiler:
+            includes = compiler["include_directories"].strip()
             if includes:
-                paths = _parse_multiline_paths(includes)
-                expanded_paths = [_expand_path_variables(p) for p in paths]
-                value = '\n'.join(f'"{p}"' for p in expanded_paths)
-                _edit_cmake_variable(userconfig_path, "USER_INCLUDE_DIRECTORIES", f"\n{value}\n")
-
-        # Optimization
-        if self.__config.has_option("compiler", "optimization_level"):
-            level = self.__config.get("compiler", "optimization_level")
-            formatted_level = _format_optimization_level(level)
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_OPTIMIZATION_LEVEL", formatted_level)
-
-        if self.__config.has_option("compiler", "optimization_other_flags"):
-            flags = self.__config.get("compiler", "optimization_other_flags")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_OPTIMIZATION_OTHER_FLAGS", flags)
-
-        # Debugging
-        if self.__config.has_option("compiler", "debug_level"):
-            level = self.__config.get("compiler", "debug_level")
-            formatted_level = _format_debug_level(level)
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_DEBUG_LEVEL", formatted_level)
-
-        if self.__config.has_option("compiler", "debug_other_flags"):
-            flags = self.__config.get("compiler", "debug_other_flags")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_DEBUG_OTHER_FLAGS", flags)
-
-        # Warnings
-        if self.__config.has_option("compiler", "warnings_all"):
-            enabled = self.__config.getboolean("compiler", "warnings_all")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_ALL",
-                               _bool_to_cmake_flag(enabled, "-Wall"))
-
-        if self.__config.has_option("compiler", "warnings_extra"):
-            enabled = self.__config.getboolean("compiler", "warnings_extra")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_EXTRA",
-                               _bool_to_cmake_flag(enabled, "-Wextra"))
-
-        if self.__config.has_option("compiler", "warnings_as_errors"):
-            enabled = self.__config.getboolean("compiler", "warnings_as_errors")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_AS_ERRORS",
-                               _bool_to_cmake_flag(enabled, "-Werror"))
-
-        if self.__config.has_option("compiler", "warnings_check_syntax_only"):
-            enabled = self.__config.getboolean("compiler", "warnings_check_syntax_only")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_CHECK_SYNTAX_ONLY",
-                               _bool_to_cmake_flag(enabled, "-fsyntax-only"))
-
-        if self.__config.has_option("compiler", "warnings_pedantic"):
-            enabled = self.__config.getboolean("compiler", "warnings_pedantic")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_PEDANTIC",
-                               _bool_to_cmake_flag(enabled, "-pedantic"))
-
-        if self.__config.has_option("compiler", "warnings_pedantic_as_errors"):
-            enabled = self.__config.getboolean("compiler", "warnings_pedantic_as_errors")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_PEDANTIC_AS_ERRORS",
-                               _bool_to_cmake_flag(enabled, "-pedantic-errors"))
-
-        if self.__config.has_option("compiler", "warnings_inhibit_all"):
-            enabled = self.__config.getboolean("compiler", "warnings_inhibit_all")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_INHIBIT_ALL",
-                               _bool_to_cmake_flag(enabled, "-w"))
-
-        # Misc
-        if self.__config.has_option("compiler", "verbose"):
-            enabled = self.__config.getboolean("compiler", "verbose")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_VERBOSE",
-                               _bool_to_cmake_flag(enabled, "-v"))
-
-        if self.__config.has_option("compiler", "ansi"):
-            enabled = self.__config.getboolean("compiler", "ansi")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_ANSI",
-                               _bool_to_cmake_flag(enabled, "-ansi"))
-
-        if self.__config.has_option("compiler", "other_flags"):
-            flags = self.__config.get("compiler", "other_flags")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_OTHER_FLAGS", flags)
+                value = '\n'.join(f'"{_expand_path_variables(p)}"' for p in _parse_multiline_paths(includes))
+                editor.set("USER_INCLUDE_DIRECTORIES", f"\n{value}\n")
+
+        # Optimization, debugging and other verbatim/formatted flags
+        for key, variable, formatter in _COMPILER_SCALAR_TABLE:
+            if key in compiler:
+                value = compiler[key]
+                editor.set(variable, formatter(value) if formatter else value)
+
+        # Warnings and misc boolean flags
+        for key, variable, flag in _COMPILER_FLAG_TABLE:
+            if key in compiler:
+                enabled = _parse_bool(compiler[key])
+                editor.set(variable, _bool_to_cmake_flag(enabled, flag))
 
         log.debug("Compiler settings configured successfully")
 
@@ -609,69 +1019,49 @@ class VitisApplication(object):
         """Configure source files in UserConfig.cmake."""
         log.debug("Configuring source files")
 
-        userconfig_path = os.path.join(
-            self.__workspace_path,
-            self.__name,
-            "src",
-            "UserConfig.cmake"
-        )
+        project_src_dir = self.__project_src_dir
 
-        if not os.path.exists(userconfig_path):
-            log.warning(f"UserConfig.cmake not found at {userconfig_path}, skipping source configuration")
-            return
+        compiler = _section_dict(self.__config, "compiler")
 
         # Source files
-        if self.__config.has_option("compiler", "source_files"):
-            sources = self.__config.get("compiler", "source_files").strip()
+        if "source_files" in compiler:
+            sources = compiler["source_files"].strip()
             if sources:
                 source_list = _parse_multiline_paths(sources)
                 expanded_sources = [_expand_path_variables(s) for s in source_list]
 
                 # These will be found by aux_source_directory() automatically
-                project_src_dir = os.path.join(
-                    self.__workspace_path,
-                    self.__name,
-                    "src"
-                )
-
-                if os.path.exists(project_src_dir):
-                    log.debug(f"Creating symlinks in {project_src_dir} for Vitis IDE")
-                    for source_file in expanded_sources:
-                        filename = os.path.basename(source_file)
-                        symlink_path = os.path.join(project_src_dir, filename)
-                        _create_symlink(source_file, symlink_path)
-                else:
-                    log.warning(f"Project src directory not found: {project_src_dir}")
+                log.debug(f"Creating symlinks in {project_src_dir} for Vitis IDE")
+                # Link names are bare basenames, plain concatenation is enough
+                src_dir_prefix = project_src_dir + os.sep
+                _create_symlinks([
+                    (source_file, src_dir_prefix + os.path.basename(source_file))
+                    for source_file in expanded_sources
+                ])
 
         # Source folders - recursively include all .c and .S files
-        if self.__config.has_option("compiler", "source_folders"):
-            folders = self.__config.get("compiler", "source_folders").strip()
+        if "source_folders" in compiler:
+            folders = compiler["source_folders"].strip()
             if folders:
                 folder_list = _parse_multiline_paths(folders)
                 expanded_folders = [_expand_path_variables(f) for f in folder_list]
 
-                project_src_dir = os.path.join(
-                    self.__workspace_path,
-                    self.__name,
-                    "src"
-                )
+                log.debug(f"Processing source folders for {project_src_dir}")
+                for folder_path in expanded_folders:
+                    # One stat answers both "exists" and "is a directory"
+                    try:
+                        folder_mode = os.stat(folder_path).st_mode
+                    except FileNotFoundError:
+                        log.warning(f"Source folder does not exist: {folder_path}")
+                        continue
 
-                if os.path.exists(project_src_dir):
-                    log.debug(f"Processing source folders for {project_src_dir}")
-                    for folder_path in expanded_folders:
-                        if not os.path.exists(folder_path):
-                            log.warning(f"Source folder does not exist: {folder_path}")
-                            continue
+                    if not stat.S_ISDIR(folder_mode):
+                        log.warning(f"Source folder path is not a directory: {folder_path}")
+                        continue
 
-                        if not os.path.isdir(folder_path):
-                            log.warning(f"Source folder path is not a directory: {folder_path}")
-                            continue
+                    folder_name = os.path.basename(folder_path)
 
-                        folder_name = os.path.basename(folder_path)
-
-                        _create_folder_symlink(folder_path, folder_name, project_src_dir)
-                else:
-                    log.warning(f"Project src directory not found: {project_src_dir}")
+                    _create_folder_symlink(folder_path, folder_name, project_src_dir, src_verified=True)
 
         log.debug("Source files configured successfully")
 
@@ -683,12 +1073,7 @@ class VitisApplication(object):
         """
         log.debug("Configuring CMakeLists.txt for recursive source discovery")
 
-        cmake_path = os.path.join(
-            self.__workspace_path,
-            self.__name,
-            "src",
-            "CMakeLists.txt"
-        )
+        cmake_path = os.path.join(self.__project_src_dir, "CMakeLists.txt")
 
         if not os.path.exists(cmake_path):
             log.warning(f"CMakeLists.txt not found at {cmake_path}, skipping CMake configuration")
@@ -697,14 +1082,8 @@ class VitisApplication(object):
         with open(cmake_path, 'r') as f:
             content = f.read()
 
-        old_pattern = r'aux_source_directory\(\$\{CMAKE_SOURCE_DIR\}\s+_sources\)'
-        new_code = '''file(GLOB_RECURSE _sources
-    FOLLOW_SYMLINKS
-    ${CMAKE_SOURCE_DIR}/*.c
-    ${CMAKE_SOURCE_DIR}/*.S
-)'''
-
-        new_content = re.sub(old_pattern, new_code, content)
+        # There is only ever one aux_source_directory() call, stop at the first match
+        new_content = _AUX_SOURCE_RE.sub(lambda m: _GLOB_SOURCES, content, count=1)
 
         if new_content == content:
             log.debug("CMakeLists.txt already configured or pattern not found")
@@ -715,94 +1094,50 @@ class VitisApplication(object):
 
         log.info("CMakeLists.txt modified to use recursive source discovery (GLOB_RECURSE)")
 
-    def __configure_linker(self) -> None:
-        """Configure linker settings in UserConfig.cmake."""
+    def __configure_linker(self, editor: _CMakeEditor) -> None:
+        """Configure linker settings in UserConfig.cmake, queued on the caller's editor."""
         log.debug("Configuring linker settings")
 
-        userconfig_path = os.path.join(
-            self.__workspace_path,
-            self.__name,
-            "src",
-            "UserConfig.cmake"
-        )
-
-        if not os.path.exists(userconfig_path):
-            log.warning(f"UserConfig.cmake not found at {userconfig_path}, skipping linker configuration")
-            return
+        # Snapshot the section once, option lookups below are plain dict hits
+        linker = _section_dict(self.__config, "linker")
 
         # General linker options
-        if self.__config.has_option("linker", "no_start_files"):
-            enabled = self.__config.getboolean("linker", "no_start_files")
-            _edit_cmake_variable(userconfig_path, "USER_LINK_NO_START_FILES",
-                               _bool_to_cmake_flag(enabled, "-nostartfiles"))
-
-        if self.__config.has_option("linker", "no_default_libs"):
-            enabled = self.__config.getboolean("linker", "no_default_libs")
-            _edit_cmake_variable(userconfig_path, "USER_LINK_NO_DEFAULT_LIBS",
-                               _bool_to_cmake_flag(enabled, "-nodefaultlibs"))
-
-        if self.__config.has_option("linker", "no_stdlib"):
-            enabled = self.__config.getboolean("linker", "no_stdlib")
-            _edit_cmake_variable(userconfig_path, "USER_LINK_NO_STDLIB",
-                               _bool_to_cmake_flag(enabled, "-nostdlib"))
-
-        if self.__config.has_option("linker", "omit_all_symbol_info"):
-            enabled = self.__config.getboolean("linker", "omit_all_symbol_info")
-            _edit_cmake_variable(userconfig_path, "USER_LINK_OMIT_ALL_SYMBOL_INFO",
-                               _bool_to_cmake_flag(enabled, "-s"))
+        for key, variable, flag in _LINKER_FLAG_TABLE:
+            if key in linker:
+                enabled = _parse_bool(linker[key])
+                editor.set(variable, _bool_to_cmake_flag(enabled, flag))
 
         # Libraries
-        if self.__config.has_option("linker", "libraries"):
-            libs = self.__config.get("linker", "libraries").strip()
+        if "libraries" in linker:
+            libs = linker["libraries"].strip()
             if libs:
-                lib_list = [l.strip() for l in libs.split(',')]
-                value = '\n'.join(f'"{l}"' for l in lib_list)
-                _edit_cmake_variable(userconfig_path, "USER_LINK_LIBRARIES", f"\n{value}\n")
+                value = _quoted_csv(libs)
+                editor.set("USER_LINK_LIBRARIES", f"\n{value}\n")
 
-        if self.__config.has_option("linker", "link_directories"):
-            paths = self.__config.get("linker", "link_directories").strip()
+        if "link_directories" in linker:
+            paths = linker["link_directories"].strip()
             if paths:
-                path_list = _parse_multiline_paths(paths)
-                expanded_paths = [_expand_path_variables(p) for p in path_list]
-                value = '\n'.join(f'"{p}"' for p in expanded_paths)
-                _edit_cmake_variable(userconfig_path, "USER_LINK_DIRECTORIES", f"\n{value}\n")
+                value = '\n'.join(f'"{_expand_path_variables(p)}"' for p in _parse_multiline_paths(paths))
+                editor.set("USER_LINK_DIRECTORIES", f"\n{value}\n")
 
         # Linker script
-        if self.__config.has_option("linker", "linker_script"):
-            script = self.__config.get("linker", "linker_script").strip()
+        if "linker_script" in linker:
+            script = linker["linker_script"].strip()
             if script:
                 expanded_script = _expand_path_variables(script)
+                linker_script_symlink = os.path.join(self.__project_src_dir, "lscript.ld")
 
-                project_src_dir = os.path.join(
-                    self.__workspace_path,
-                    self.__name,
-                    "src"
-                )
-
-                if os.path.exists(project_src_dir):
-                    linker_script_symlink = os.path.join(project_src_dir, "lscript.ld")
-
-                    if os.path.exists(linker_script_symlink) or os.path.islink(linker_script_symlink):
-                        try:
-                            os.remove(linker_script_symlink)
-                            log.debug(f"Removed existing linker script at {linker_script_symlink}")
-                        except Exception as e:
-                            log.warning(f"Failed to remove existing linker script: {e}")
-
-                    if _create_symlink(expanded_script, linker_script_symlink):
-                        _edit_cmake_variable(userconfig_path, "USER_LINKER_SCRIPT",
-                                           '"${CMAKE_SOURCE_DIR}/lscript.ld"')
-                    else:
-                        log.warning(f"Failed to create linker script symlink, using absolute path")
-                        _edit_cmake_variable(userconfig_path, "USER_LINKER_SCRIPT", f'"{expanded_script}"')
+                if _replace_symlink(expanded_script, linker_script_symlink):
+                    editor.set("USER_LINKER_SCRIPT",
+                               '"${CMAKE_SOURCE_DIR}/lscript.ld"')
                 else:
-                    log.warning(f"Project src directory not found: {project_src_dir}, using absolute path for linker script")
-                    _edit_cmake_variable(userconfig_path, "USER_LINKER_SCRIPT", f'"{expanded_script}"')
+                    log.warning(f"Failed to create linker script symlink, using absolute path")
+                    editor.set("USER_LINKER_SCRIPT", f'"{expanded_script}"')
 
         # Misc linker flags
-        if self.__config.has_option("linker", "other_flags"):
-            flags = self.__config.get("linker", "other_flags")
-            _edit_cmake_variable(userconfig_path, "USER_LINK_OTHER_FLAGS", flags)
+        if "other_flags" in linker:
+            flags = linker["other_flags"]
+            editor.set("USER_LINK_OTHER_FLAGS", flags)
 
         log.debug("Linker settings configured successfully")
 
@@ -818,36 +1153,47 @@ class VitisApplication(object):
             "launch.json"
         )
 
-        os.makedirs(os.path.dirname(launch_json_path), exist_ok=True)
-
-        if os.path.exists(launch_json_path):
-            with open(launch_json_path, 'r') as f:
-                launch_data = json.load(f)
-        else:
+        # Open directly rather than checking first, a missing file just means starting fresh
+        try:
+            with open(launch_json_path, 'rb') as f:
+                old_bytes = f.read()
+            launch_data = _json_loads(old_bytes)
+        except FileNotFoundError:
+            old_bytes = None
             launch_data = {
                 "version": "0.2.0",
                 "configurations": []
             }
 
+        configurations = launch_data["configurations"]
+
+        # Index existing entries by name once, first occurrence wins as with a linear search
+        name_to_idx = {}
+        for idx, config in enumerate(configurations):
+            name_to_idx.setdefault(config["name"], idx)
+
         for launch_config in self.__launch_configs:
             new_config = launch_config.generate_launch_config()
             config_name = new_config["name"]
 
-            existing_idx = None
-            for idx, config in enumerate(launch_data["configurations"]):
-                if config["name"] == config_name:
-                    existing_idx = idx
-                    break
-
+            existing_idx = name_to_idx.get(config_name)
             if existing_idx is not None:
                 log.debug(f"Updating existing launch configuration: {config_name}")
-                launch_data["configurations"][existing_idx] = new_config
+                configurations[existing_idx] = new_config
             else:
                 log.debug(f"Adding new launch configuration: {config_name}")
-                launch_data["configurations"].append(new_config)
+                name_to_idx[config_name] = len(configurations)
+                configurations.append(new_config)
+
+        # Re-runs usually produce the same file, leave it (and its mtime) alone then
+        new_bytes = _json_dumps(launch_data)
+        if new_bytes == old_bytes:
+            log.debug("launch.json is already up to date")
+            return
 
-        with open(launch_json_path, 'w') as f:
-            json.dump(launch_data, f, indent=2)
+        os.makedirs(os.path.dirname(launch_json_path), exist_ok=True)
+        with open(launch_json_path, 'wb') as f:
+            f.write(new_bytes)
 
         log.debug("Launch settings configured successfully")
 
@@ -859,42 +1205,38 @@ class VitisApplication(object):
         """
         log.debug("Creating/updating common .clangd configuration")
 
-        source_paths = []
+        compiler = _section_dict(self.__config, "compiler")
 
-        if self.__config.has_option("compiler", "source_folders"):
-            folders = self.__config.get("compiler", "source_folders").strip()
+        # A set: many source files share a directory, commonpath only needs each once
+        source_paths = set()
+
+        if "source_folders" in compiler:
+            folders = compiler["source_folders"].strip()
             if folders:
-                folder_list = _parse_multiline_paths(folders)
-                expanded_folders = [_expand_path_variables(f) for f in folder_list]
-                source_paths.extend(expanded_folders)
+                source_paths.update(_expand_path_variables(f) for f in _parse_multiline_paths(folders))
 
-        if self.__config.has_option("compiler", "source_files"):
-            sources = self.__config.get("compiler", "source_files").strip()
+        if "source_files" in compiler:
+            sources = compiler["source_files"].strip()
             if sources:
-                source_list = _parse_multiline_paths(sources)
-                expanded_sources = [_expand_path_variables(s) for s in source_list]
-                source_paths.extend([os.path.dirname(f) for f in expanded_sources])
+                source_paths.update(os.path.dirname(_expand_path_variables(s)) for s in _parse_multiline_paths(sources))
 
         project_dir = os.path.join(self.__workspace_path, self.__name)
-        source_paths.append(project_dir)
+        source_paths.add(project_dir)
 
         if not source_paths:
             log.warning("No source paths found, cannot determine common parent")
             return
 
-        common_parent = os.path.commonpath(source_paths)
+        common_parent = _common_parent(list(source_paths))
         log.info(f"Common parent for source files: {common_parent}")
 
         clangd_path = os.path.join(common_parent, ".clangd")
-        clangd_content = """CompileFlags:
-    Add: [-Wno-unknown-warning-option, -U__linux__, -U__clang__]
-    Remove: [-m*, -f*]
-"""
 
         try:
-            with open(clangd_path, 'w') as f:
-                f.write(clangd_content)
-            log.info(f"Created/updated .clangd at {clangd_path}")
+            if _write_clangd(clangd_path):
+                log.info(f"Created/updated .clangd at {clangd_path}")
+            else:
+                log.debug(f".clangd already up to date at {clangd_path}")
         except Exception as e:
             log.warning(f"Failed to create .clangd at {clangd_path}: {e}")
             return
@@ -906,23 +1248,31 @@ class VitisApplication(object):
             log.warning(f"compile_commands.json not found at {compile_db_src}")
             return
 
-        if os.path.exists(compile_db_dest) or os.path.islink(compile_db_dest):
-            try:
-                os.remove(compile_db_dest)
-                log.debug(f"Removed existing compile_commands.json at {compile_db_dest}")
-            except Exception as e:
-                log.warning(f"Failed to remove old compile_commands.json: {e}")
+        rel_path = os.path.relpath(compile_db_src, common_parent)
 
+        # Nothing to do if this project is already the linked one (symlink or hardlink)
         try:
-            rel_path = os.path.relpath(compile_db_src, common_parent)
-            os.symlink(rel_path, compile_db_dest)
+            if os.path.islink(compile_db_dest):
+                already_linked = os.readlink(compile_db_dest) == rel_path
+            else:
+                already_linked = os.path.samefile(compile_db_src, compile_db_dest)
+        except OSError:
+            already_linked = False
+
+        if already_linked:
+            log.debug(f"compile_commands.json already linked at {compile_db_dest}")
+            return
+
+        if _atomic_symlink(rel_path, compile_db_dest):
             log.info(f"Created symlink: {compile_db_dest} -> {rel_path}")
-        except (OSError, NotImplementedError) as e:
-            # Symlink not supported (Windows without admin) - copy instead
-            log.debug(f"Symlink not available ({e}), copying instead")
+        else:
+            # Symlink not supported (Windows without admin) - hardlink, or copy if that fails too
+            log.debug("Symlink not available, hardlinking instead")
             try:
-                shutil.copy2(compile_db_src, compile_db_dest)
-                log.info(f"Copied compile_commands.json to {common_parent}")
+                if _atomic_link_or_copy(compile_db_src, compile_db_dest):
+                    log.info(f"Hardlinked compile_commands.json to {common_parent}")
+                else:
+                    log.info(f"Copied compile_commands.json to {common_parent}")
             except Exception as e:
                 log.warning(f"Failed to copy compile_commands.json: {e}")
 
@@ -9,8 +9,11 @@ import os
 import platform
 import re
 import shutil
+import stat
 import subprocess
-from typing import List, TypeVar
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
 # Add package: Vitis Python CLI
 # import vitis # type: ignore
@@ -20,12 +23,18 @@ from vitis_logging import Logger
 from vitis_paths import (
     read_config, PROJECTS_PATH, TOP_PATH, SRC_PATH, get_vitis_root
 )
-from vitis_application import _parse_multiline_paths, _expand_path_variables
+from vitis_application import (
+    VitisApplication, _parse_multiline_paths, _expand_path_variables, _atomic_symlink,
+    _atomic_link_or_copy, _common_parent, _section_dict, _write_clangd
+)
 
 log = Logger("build")
 
+_APP_SECTION_RE = re.compile(r"application_\d+")
+_DOMAIN_SECTION_RE = re.compile(r"domain_\d+")
+
 
-def activate_project(project_name: str) -> bool:
+def activate_project(project_name: str, project_dir_verified: bool = False) -> bool:
     """
     Activate a project by updating .clangd and compile_commands.json at common parent.
 
@@ -33,6 +42,8 @@ def activate_project(project_name: str) -> bool:
 
     Args:
         project_name: Name of the project to activate
+        project_dir_verified: True if the caller already checked the project directory exists
+                              (e.g. right after a successful build)
 
     Returns:
         True if activation successful, False otherwise
@@ -40,7 +51,7 @@ def activate_project(project_name: str) -> bool:
     log.info(f"Activating project: {project_name}")
 
     project_dir = os.path.join(PROJECTS_PATH, project_name)
-    if not os.path.exists(project_dir):
+    if not project_dir_verified and not os.path.exists(project_dir):
         log.error(f"Project not found: {project_dir}")
         log.error(f"Run './Vitis/Do CREATE {project_name}' first")
         return False
@@ -80,42 +91,35 @@ def activate_project(project_name: str) -> bool:
         log.warning("No source paths found, using default common parent")
         common_parent = SRC_PATH
     else:
-        common_parent = os.path.commonpath(source_paths)
+        common_parent = _common_parent(source_paths)
 
     log.info(f"Common parent: {common_parent}")
 
     clangd_path = os.path.join(common_parent, ".clangd")
-    clangd_content = """CompileFlags:
-    Add: [-Wno-unknown-warning-option, -U__linux__, -U__clang__]
-    Remove: [-m*, -f*]
-"""
 
     try:
-        with open(clangd_path, 'w') as f:
-            f.write(clangd_content)
-        log.debug(f"Created/updated .clangd at {clangd_path}")
+        if _write_clangd(clangd_path):
+            log.debug(f"Created/updated .clangd at {clangd_path}")
+        else:
+            log.debug(f".clangd already up to date at {clangd_path}")
     except Exception as e:
         log.error(f"Failed to create .clangd: {e}")
         return False
 
     compile_db_dest = os.path.join(common_parent, "compile_commands.json")
 
-    if os.path.exists(compile_db_dest) or os.path.islink(compile_db_dest):
-        try:
-            os.remove(compile_db_dest)
-            log.debug(f"Removed existing compile_commands.json at {compile_db_dest}")
-        except Exception as e:
-            log.warning(f"Failed to remove old compile_commands.json: {e}")
-
-    try:
-        rel_path = os.path.relpath(compile_db_src, common_parent)
-        os.symlink(rel_path, compile_db_dest)
+    rel_path = os.path.relpath(compile_db_src, common_parent)
+    if _atomic_symlink(rel_path, compile_db_dest):
         log.info(f"Created symlink: {compile_db_dest} -> {rel_path}")
-    except (OSError, NotImplementedError) as e:
-        log.debug(f"Symlink not available ({e}), copying instead")
+    else:
+        # The new file is staged beside the old one and renamed over it, so an old
+        # symlink is replaced rather than written through
+        log.debug("Symlink not available, hardlinking instead")
         try:
-            shutil.copy2(compile_db_src, compile_db_dest)
-            log.info(f"Copied compile_commands.json to {common_parent}")
+            if _atomic_link_or_copy(compile_db_src, compile_db_dest):
+                log.info(f"Hardlinked compile_commands.json to {common_parent}")
+            else:
+                log.info(f"Copied compile_commands.json to {common_parent}")
         except Exception as e:
             log.error(f"Failed to copy compile_commands.json: {e}")
             return False
@@ -124,6 +128,129 @@ def activate_project(project_name: str) -> bool:
     return True
 
 
+def _collect_project_graph(config_folder: str) -> Dict[str, Any]:
+    """
+    Scan platform.conf and vitis.conf once for the components of a project.
+
+    Args:
+        config_folder: Project configuration folder (Top/<project>)
+
+    Returns:
+        Dict with:
+            'domains': [{'name', 'processor'}] in build order
+            'applications': [{'section', 'name', 'config', 'description'}] in build order,
+                            'name'/'config' are None when the section lacks them
+            'boot_components': True if the platform has an FSBL to build
+    """
+    platform_config = read_config(config_folder, "platform")
+    vitis_config = read_config(config_folder, "vitis")
+
+    domains = []
+
+    if platform_config.has_section('domain'):
+        domains.append({
+            'name': platform_config.get('domain', 'NAME'),
+            'processor': platform_config.get('domain', 'PROCESSOR_INSTANCE')
+        })
+
+    # Add additional domains (domain_1, domain_2, etc.)
+    domain_sections = [s for s in platform_config.sections()
+                       if _DOMAIN_SECTION_RE.match(s)]
+
+    for section in sorted(domain_sections):
+        if platform_config.has_option(section, 'NAME') and \
+           platform_config.has_option(section, 'PROCESSOR_INSTANCE'):
+            domains.append({
+                'name': platform_config.get(section, 'NAME'),
+                'processor': platform_config.get(section, 'PROCESSOR_INSTANCE')
+            })
+
+    # Additional applications (application_1, application_2, etc.) follow [application]
+    application_sections = ['application'] if vitis_config.has_section('application') else []
+    application_sections += sorted(s for s in vitis_config.sections() if _APP_SECTION_RE.match(s))
+
+    applications = []
+    for section in application_sections:
+        name = vitis_config.get(section, 'NAME', fallback=None)
+        applications.append({
+            'section': section,
+            'name': name,
+            'config': vitis_config.get(section, 'CONFIG', fallback=None),
+            'description': vitis_config.get(section, 'DESCRIPTION',
+                                            fallback=f"{name} application component")
+        })
+
+    return {
+        'domains': domains,
+        'applications': applications,
+        'boot_components': platform_config.getboolean("boot", "BOOT_COMPONENTS", fallback=True),
+    }
+
+
+def _application_source_roots(config_folder: str, config: str) -> List[str]:
+    """
+    Everything outside the app folder that configure() wires into an application's build:
+    the source folders, the folder of every single source file, the include and link
+    directories, and the linker script.
+
+    Args:
+        config_folder: Project configuration folder (Top/<project>)
+        config: Application configuration name (CONFIG in vitis.conf)
+
+    Returns:
+        Expanded directory and file paths, without duplicates
+    """
+    app_config = read_config(config_folder, config)
+    compiler = _section_dict(app_config, 'compiler')
+    linker = _section_dict(app_config, 'linker')
+
+    roots = [_expand_path_variables(f)
+             for f in _parse_multiline_paths(compiler.get('source_folders', ''))]
+    roots += [os.path.dirname(_expand_path_variables(f))
+              for f in _parse_multiline_paths(compiler.get('source_files', ''))]
+    roots += [_expand_path_variables(d)
+              for d in _parse_multiline_paths(compiler.get('include_directories', ''))]
+    roots += [_expand_path_variables(d)
+              for d in _parse_multiline_paths(linker.get('link_directories', ''))]
+
+    script = linker.get('linker_script', '').strip()
+    if script:
+        roots.append(_expand_path_variables(script))
+
+    return list(dict.fromkeys(roots))
+
+
+@lru_cache(maxsize=None)
+def _newest_mtime_ns(roots: Tuple[str, ...]) -> int:
+    """
+    Newest modification time of any file or directory below the given directories, the
+    directories themselves included, or of the given files. A directory's time changes when
+    an entry is added, deleted or renamed, which a file's own time does not show.
+    Symlinked files count with their target's time, symlinked directories are not entered.
+    Results are cached, build_project_all_ninja clears the cache for every build.
+
+    Raises:
+        OSError: If a root is missing or a file cannot be stat'ed
+    """
+    newest = 0
+    pending = []
+
+    for root in roots:
+        root_stat = os.stat(root)
+        newest = max(newest, root_stat.st_mtime_ns)
+        if stat.S_ISDIR(root_stat.st_mode):
+            pending.append(root)
+
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                newest = max(newest, entry.stat().st_mtime_ns)
+
+    return newest
+
+
 class ProjectBuilder(object):
     """
     Build all components of a project (platform + applications).
@@ -146,12 +273,14 @@ class ProjectBuilder(object):
 
         self.__config_folder = config_folder
         self.__config_top = read_config(config_folder, "vitis")
+        self.__graph = _collect_project_graph(config_folder)
 
         self.__platform = self.__load_platform()
         self.__applications = self.__load_applications()
 
     def __load_platform(self):
         """Load platform component for building."""
+        # Imported here so ACTIVATE and single ninja builds never load vitis_platform
         from vitis_platform import VitisPlatform
 
         return VitisPlatform(
@@ -165,49 +294,33 @@ class ProjectBuilder(object):
 
     def __load_applications(self) -> List:
         """Load all application components for building."""
-        from vitis_application import VitisApplication
-
         applications = []
 
-        if self.__config_top.has_section('application'):
-            app = self.__load_single_application('application')
-            if app:
-                applications.append(app)
-
-        # Load additional applications (application_1, application_2, etc.)
-        application_sections = [s for s in self.__config_top.sections()
-                                if re.match(r"application_\d+", s)]
-
-        for section in sorted(application_sections):
-            app = self.__load_single_application(section)
+        for app_info in self.__graph['applications']:
+            app = self.__load_single_application(app_info)
             if app:
                 applications.append(app)
 
         return applications
 
-    def __load_single_application(self, section: str):
-        """Load a single application from config section."""
-        from vitis_application import VitisApplication
+    def __load_single_application(self, app_info: Dict[str, Any]):
+        """Load a single application from its project graph entry."""
+        section = app_info['section']
 
-        if not self.__config_top.has_option(section, 'NAME'):
+        if app_info['name'] is None:
             log.warning(f"Application section [{section}] missing NAME, skipping")
             return None
 
-        if not self.__config_top.has_option(section, 'CONFIG'):
+        if app_info['config'] is None:
             log.warning(f"Application section [{section}] missing CONFIG, skipping")
             return None
 
-        app_name = self.__config_top.get(section, 'NAME')
-        app_config = self.__config_top.get(section, 'CONFIG')
-        app_description = self.__config_top.get(section, 'DESCRIPTION',
-                                                 fallback=f"{app_name} application component")
-
         return VitisApplication(
             client=self.__client,
-            name=app_name,
-            description=app_description,
+            name=app_info['name'],
+            description=app_info['description'],
             config_folder=self.__config_folder,
-            config=app_config,
+            config=app_info['config'],
             workspace_path=PROJECTS_PATH
         )
 
@@ -259,8 +372,15 @@ def find_ninja_executable(use_system: bool) -> str:
     Raises:
         RuntimeError: If ninja not found or version too old
     """
+    # PATH is part of the key so a changed environment resolves ninja again
+    return _find_ninja_cached(use_system, os.environ.get("PATH", ""))
+
+
+@lru_cache(maxsize=4)
+def _find_ninja_cached(use_system: bool, path_env: str) -> str:
+    """Resolve (and for system ninja, version-check) the ninja executable once per mode and PATH."""
     if use_system:
-        ninja_path = shutil.which("ninja")
+        ninja_path = shutil.which("ninja", path=path_env or None)
 
         if not ninja_path:
             raise RuntimeError(
@@ -340,20 +460,19 @@ def build_project_ninja(project_name: str, clean: bool = False, use_system_ninja
     project_dir = os.path.join(PROJECTS_PATH, project_name)
     build_dir = os.path.join(project_dir, "build")
 
-    if not os.path.exists(project_dir):
-        log.error(f"Project not found: {project_dir}")
-        log.error(f"Run './Vitis/Do CREATE {project_name}' first")
-        return 1
-
-    if not os.path.exists(build_dir):
-        log.error(f"Build directory not found: {build_dir}")
-        log.error("Project must be created with Vitis first to generate build files")
-        return 1
-
+    # CMakeCache.txt existing implies the build and project directories do too,
+    # so a configured project costs one stat; walk up only to explain a failure
     cmake_cache = os.path.join(build_dir, "CMakeCache.txt")
     if not os.path.exists(cmake_cache):
-        log.error(f"CMakeCache.txt not found in {build_dir}")
-        log.error("Project must be created with Vitis first to configure CMake")
+        if not os.path.exists(project_dir):
+            log.error(f"Project not found: {project_dir}")
+            log.error(f"Run './Vitis/Do CREATE {project_name}' first")
+        elif not os.path.exists(build_dir):
+            log.error(f"Build directory not found: {build_dir}")
+            log.error("Project must be created with Vitis first to generate build files")
+        else:
+            log.error(f"CMakeCache.txt not found in {build_dir}")
+            log.error("Project must be created with Vitis first to configure CMake")
         return 1
 
     try:
@@ -366,29 +485,18 @@ def build_project_ninja(project_name: str, clean: bool = False, use_system_ninja
 
     if clean:
         log.info("Cleaning build artifacts...")
-        log.debug(f"Executing command in '{build_dir}': {ninja_path} clean")
-        clean_result = subprocess.run(
-            [ninja_path, "clean"],
-            cwd=build_dir,
-            capture_output=False
-        )
-        if clean_result.returncode != 0:
+        if _run_ninja([ninja_path, "clean"], build_dir, project_name) != 0:
             log.warning("Clean failed, continuing with build anyway")
 
     log.info("Running Ninja build...")
-    log.debug(f"Executing command in '{build_dir}': {ninja_path}")
-    result = subprocess.run(
-        [ninja_path],
-        cwd=build_dir,
-        capture_output=False
-    )
+    returncode = _run_ninja([ninja_path], build_dir, project_name)
 
-    if result.returncode == 0:
+    if returncode == 0:
         log.info(f"Build successful: {project_name}.elf")
     else:
-        log.error(f"Build failed with exit code: {result.returncode}")
+        log.error(f"Build failed with exit code: {returncode}")
 
-    return result.returncode
+    return returncode
 
 
 def build_project_vitis(client, project_name: str) -> int:
@@ -454,7 +562,9 @@ def build_project_all(client: vitis_client, project_name: str) -> int: # pyright
 def build_project_all_ninja(
     project_name: str,
     clean: bool = False,
-    use_system_ninja: bool = False
+    use_system_ninja: bool = False,
+    parallel: bool = False,
+    incremental: bool = False
 ) -> int:
     """
     Build entire project (platform + all applications) using Ninja directly.
@@ -468,6 +578,10 @@ def build_project_all_ninja(
         project_name: Name of project (folder in Top/ and Projects/)
         clean: If True, clean before building
         use_system_ninja: If True, use system ninja; else use Vitis-bundled
+        parallel: If True, build the BSPs of different domains, and the applications,
+                  concurrently within their stage
+        incremental: If True, don't run ninja for applications whose ELF is newer than
+                     build.ninja, their sources and the BSP headers/libraries
 
     Returns:
         Exit code (0 = success)
@@ -491,41 +605,25 @@ def build_project_all_ninja(
         log.error(f"Run './Vitis/Do CREATE {project_name}' first")
         return 1
 
-    platform_config = read_config(config_folder, "platform")
+    graph = _collect_project_graph(config_folder)
+
+    # Sources may have changed since the last build in this process
+    _newest_mtime_ns.cache_clear()
 
     # Step 1: Build all BSPs (one per domain)
     log.info("Building BSPs (Board Support Packages)...")
 
-    domains = []
-
-    if platform_config.has_section('domain'):
-        domains.append({
-            'name': platform_config.get('domain', 'NAME'),
-            'processor': platform_config.get('domain', 'PROCESSOR_INSTANCE')
-        })
-
-    # Add additional domains (domain_1, domain_2, etc.)
-    domain_sections = [s for s in platform_config.sections()
-                       if re.match(r"domain_\d+", s)]
-
-    for section in sorted(domain_sections):
-        if platform_config.has_option(section, 'NAME') and \
-           platform_config.has_option(section, 'PROCESSOR_INSTANCE'):
-            domains.append({
-                'name': platform_config.get(section, 'NAME'),
-                'processor': platform_config.get(section, 'PROCESSOR_INSTANCE')
-            })
-
+    domains = graph['domains']
     if not domains:
         log.error("No domains found in platform.conf")
         return 1
 
-    for i, domain in enumerate(domains):
+    bsp_components = []
+    bsp_outputs = []
+    for domain in domains:
         domain_name = domain['name']
         processor = domain['processor']
 
-        log.info(f"Building BSP for domain {domain_name}...")
-
         # Construct BSP build directory path
         bsp_build_dir = os.path.join(
             platform_dir,
@@ -534,25 +632,27 @@ def build_project_all_ninja(
             "bsp", "libsrc", "build_configs", "gen_bsp"
         )
 
-        if not os.path.exists(bsp_build_dir):
-            log.error(f"BSP build directory not found: {bsp_build_dir}")
-            return 1
-
+        # One stat for the usual case, the directory is only checked to explain a failure
         if not os.path.exists(os.path.join(bsp_build_dir, "build.ninja")):
-            log.error(f"build.ninja not found in {bsp_build_dir}")
+            if not os.path.exists(bsp_build_dir):
+                log.error(f"BSP build directory not found: {bsp_build_dir}")
+            else:
+                log.error(f"build.ninja not found in {bsp_build_dir}")
             return 1
 
-        exit_code = _run_ninja_in_directory(
-            ninja_path, bsp_build_dir, clean, f"BSP ({domain_name})"
-        )
-        if exit_code != 0:
-            log.error(f"BSP build failed for domain {domain_name}")
-            return exit_code
+        bsp_components.append((bsp_build_dir, f"BSP ({domain_name})", None, ()))
 
-    # Step 2: Build FSBL (if BOOT_COMPONENTS is true)
-    has_boot_components = platform_config.getboolean("boot", "BOOT_COMPONENTS", fallback=True)
+        bsp_dir = os.path.join(platform_dir, processor, domain_name, "bsp")
+        bsp_outputs += [os.path.join(bsp_dir, "include"), os.path.join(bsp_dir, "lib")]
 
-    if has_boot_components:
+    # BSPs of different domains do not depend on each other
+    exit_code, failed = _run_ninja_stage(ninja_path, bsp_components, clean, parallel)
+    if exit_code != 0:
+        log.error(f"BSP build failed for domain {domains[failed]['name']}")
+        return exit_code
+
+    # Step 2: Build FSBL (if BOOT_COMPONENTS is true)
+    if graph['boot_components']:
         log.info("Building FSBL (First Stage Boot Loader)...")
         fsbl_build_dir = os.path.join(platform_dir, "zynq_fsbl", "build")
 
@@ -573,28 +673,16 @@ def build_project_all_ninja(
     # Step 3: Build all applications
     log.info("Building applications...")
 
-    vitis_config = read_config(config_folder, "vitis")
-
-    app_names = []
-
-    if vitis_config.has_section('application') and \
-       vitis_config.has_option('application', 'NAME'):
-        app_names.append(vitis_config.get('application', 'NAME'))
-
-    # Find additional applications (application_1, application_2, etc.)
-    application_sections = [s for s in vitis_config.sections()
-                            if re.match(r"application_\d+", s)]
-
-    for section in sorted(application_sections):
-        if vitis_config.has_option(section, 'NAME'):
-            app_names.append(vitis_config.get(section, 'NAME'))
+    apps = [app for app in graph['applications'] if app['name'] is not None]
+    app_names = [app['name'] for app in apps]
 
     if not app_names:
         log.warning("No applications found in vitis.conf")
         return 0
 
-    for app_name in app_names:
-        log.info(f"Building application: {app_name}...")
+    app_components = []
+    for app in apps:
+        app_name = app['name']
         app_build_dir = os.path.join(PROJECTS_PATH, app_name, "build")
 
         if not os.path.exists(app_build_dir):
@@ -602,62 +690,177 @@ def build_project_all_ninja(
             log.error(f"Application '{app_name}' may not have been created")
             return 1
 
-        exit_code = _run_ninja_in_directory(
-            ninja_path, app_build_dir, clean, f"Application {app_name}"
-        )
-        if exit_code != 0:
-            log.error(f"Application {app_name} build failed")
-            return exit_code
+        output_artifact = None
+        source_roots: Tuple[str, ...] = ()
+        if incremental and app['config'] is not None:
+            try:
+                # The app's src folder holds the generated CMake files and links to the sources
+                source_roots = tuple(
+                    _application_source_roots(config_folder, app['config'])
+                    + [os.path.join(PROJECTS_PATH, app_name, "src")]
+                    + bsp_outputs
+                )
+                output_artifact = os.path.join(app_build_dir, f"{app_name}.elf")
+            except Exception as e:
+                log.warning(f"Can't determine the inputs of {app_name}, building it with ninja: {e}")
+                source_roots = ()
+
+        app_components.append((app_build_dir, f"Application {app_name}", output_artifact, source_roots))
+
+    # Applications only depend on the platform, not on each other
+    exit_code, failed = _run_ninja_stage(ninja_path, app_components, clean, parallel)
+    if exit_code != 0:
+        log.error(f"Application {app_names[failed]} build failed")
+        return exit_code
 
     log.info(f"Full project {project_name} build complete")
     return 0
 
 
+def _run_ninja_stage(
+    ninja_path: str,
+    components: List[Tuple[str, str, Optional[str], Tuple[str, ...]]],
+    clean: bool,
+    parallel: bool
+) -> Tuple[int, int]:
+    """
+    Run ninja for the independent components of one build stage (all BSPs, or all applications).
+
+    When running in parallel the CPU cores are split between the concurrent ninja
+    processes, so the stage as a whole does not oversubscribe the machine.
+
+    Args:
+        ninja_path: Path to ninja executable
+        components: (build directory, component name, output artifact, source roots) with no
+                    dependencies between them, see _run_ninja_in_directory for the last two
+        clean: If True, run ninja clean first
+        parallel: If True, build the components concurrently
+
+    Returns:
+        (exit code, index of the failed component); the index is -1 on success
+    """
+    cpu_count = os.cpu_count() or 1
+    workers = min(len(components), cpu_count)
+
+    if not parallel or workers < 2:
+        for i, (build_dir, component_name, output_artifact, source_roots) in enumerate(components):
+            exit_code = _run_ninja_in_directory(
+                ninja_path, build_dir, clean, component_name,
+                output_artifact=output_artifact, source_roots=source_roots
+            )
+            if exit_code != 0:
+                return exit_code, i
+        return 0, -1
+
+    jobs = max(1, cpu_count // workers)
+    log.debug(f"Building {len(components)} components in parallel, {jobs} ninja jobs each")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _run_ninja_in_directory, ninja_path, build_dir, clean, component_name, jobs,
+                output_artifact, source_roots
+            ): i
+            for i, (build_dir, component_name, output_artifact, source_roots) in enumerate(components)
+        }
+        for future in as_completed(futures):
+            exit_code = future.result()
+            if exit_code != 0:
+                # Don't start queued components, the ones already running finish on their own
+                for pending in futures:
+                    pending.cancel()
+                return exit_code, futures[future]
+
+    return 0, -1
+
+
 def _run_ninja_in_directory(
     ninja_path: str,
     build_dir: str,
     clean: bool,
-    component_name: str
+    component_name: str,
+    jobs: int = 0,
+    output_artifact: Optional[str] = None,
+    source_roots: Tuple[str, ...] = ()
 ) -> int:
     """
     Run ninja in a specific directory.
 
+    With an output artifact, ninja is not started at all when the artifact is newer than
+    build.ninja and every file below source_roots. Anything that can't be stat'ed runs ninja.
+
     Args:
         ninja_path: Path to ninja executable
         build_dir: Directory containing build.ninja
         clean: If True, run ninja clean first
         component_name: Human-readable component name for logging
+        jobs: Parallel jobs for ninja (-j), 0 for ninja's default
+        output_artifact: Final build output (e.g. the ELF), None to always run ninja
+        source_roots: Directories whose files the artifact is built from
 
     Returns:
         Exit code (0 = success)
     """
     build_ninja = os.path.join(build_dir, "build.ninja")
-    if not os.path.exists(build_ninja):
+    try:
+        build_ninja_mtime = os.stat(build_ninja).st_mtime_ns
+    except FileNotFoundError:
         log.error(f"build.ninja not found in {build_dir}")
         return 1
 
+    if output_artifact and not clean:
+        try:
+            inputs_mtime = max(build_ninja_mtime, _newest_mtime_ns(source_roots))
+            if os.stat(output_artifact).st_mtime_ns > inputs_mtime:
+                log.info(f"{component_name} is up to date, skipping ninja")
+                return 0
+        except OSError as e:
+            log.debug(f"Up-to-date check failed for {component_name}, running ninja: {e}")
+
     if clean:
         log.info(f"Cleaning {component_name}...")
-        log.debug(f"Executing command in '{build_dir}': {ninja_path} clean")
-        result = subprocess.run(
-            [ninja_path, "clean"],
-            cwd=build_dir,
-            capture_output=False
-        )
-        if result.returncode != 0:
+        if _run_ninja([ninja_path, "clean"], build_dir, component_name) != 0:
             log.warning(f"Clean failed for {component_name}, continuing anyway")
 
+    command = [ninja_path, "-j", str(jobs)] if jobs else [ninja_path]
+
     log.info(f"Running ninja for {component_name}...")
-    log.debug(f"Executing command in '{build_dir}': {ninja_path}")
-    result = subprocess.run(
-        [ninja_path],
-        cwd=build_dir,
-        capture_output=False
-    )
+    returncode = _run_ninja(command, build_dir, component_name)
 
-    if result.returncode == 0:
+    if returncode == 0:
         log.info(f"{component_name} build successful")
     else:
-        log.error(f"{component_name} build failed with exit code: {result.returncode}")
+        log.error(f"{component_name} build failed with exit code: {returncode}")
+
+    return returncode
+
 
-    return result.returncode
+def _run_ninja(command: List[str], build_dir: str, component_name: str) -> int:
+    """
+    Run a ninja command, forwarding its output line by line through the logger.
+
+    Each line is tagged with the component, so concurrent builds stay readable
+    and the output also lands in the log file.
+
+    Args:
+        command: Ninja command line
+        build_dir: Directory containing build.ninja
+        component_name: Human-readable component name used as the line prefix
+
+    Returns:
+        Exit code of the ninja process
+    """
+    log.debug(f"Executing command in '{build_dir}': {' '.join(command)}")
+    with subprocess.Popen(
+        command,
+        cwd=build_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1
+    ) as process:
+        for line in process.stdout:
+            log.info(f"[{component_name}] {line.rstrip()}")
+
+    return process.returncode
@@ -1,12 +1,7 @@
 import argparse
-import configparser
-from functools import partial
-import inspect
 import os
 from pathlib import Path
 import re
-import shutil
-import sys
 from typing import List, TypeVar
 
 # Add package: Vitis Python CLI
@@ -14,17 +9,22 @@ from typing import List, TypeVar
 vitis_client = TypeVar('vitis_client')
 
 from vitis_logging import Logger
-from vitis_paths import read_config, parentdir, PROJECTS_PATH, TOP_PATH
+from vitis_paths import read_config, PROJECTS_PATH, TOP_PATH
 from vitis_platform import VitisPlatform
 from vitis_application import VitisApplication
 
 
 log = Logger("create")
 
+_APP_SECTION_RE = re.compile(r"application_\d+")
+
 
 def create_workspace(client: vitis_client) -> None: # pyright: ignore[reportInvalidTypeVarUse]
     log.info(f"Attempting to make workspace in {PROJECTS_PATH}")
-    Path(os.path.join(parentdir, "Projects")).mkdir(parents=True, exist_ok=True)
+    if not os.path.isdir(PROJECTS_PATH):
+        Path(PROJECTS_PATH).mkdir(parents=True, exist_ok=True)
+
+    # Every new client session must be pointed at the workspace, even if it already exists on disk
     client.set_workspace( # type: ignore
         path=PROJECTS_PATH
     )
@@ -70,7 +70,7 @@ class ProjectCreator(object):
 
         # Find all additional application sections (application_1, application_2, etc.)
         application_sections = [s for s in self.__config_top.sections()
-                                if re.match(r"application_\d+", s)]
+                                if _APP_SECTION_RE.match(s)]
 
         for section in sorted(application_sections):
             self.__create_single_application(section)
@@ -2,12 +2,10 @@ import logging
 import logging.config
 import sys
 import os
-import json
-from datetime import datetime
 from pathlib import Path
 import traceback
 
-from vitis_paths import currentdir, LOG_PATH
+from vitis_paths import LOG_PATH
 
 
 APP_LOGGER_NAME = 'Vitis Workspace Builder'
@@ -1,4 +1,5 @@
 import configparser
+from functools import lru_cache
 import inspect
 import os
 import platform
@@ -21,11 +22,29 @@ LOG_PATH = os.path.join(parentdir, "logs")
 _VITIS_ROOT = None
 _VITIS_VERSION = None
 
+# Cached parsed configs: config path -> (mtime, parser)
+_CONFIG_CACHE = {}
+
 
 def read_config(config_folder: str, filename: str) -> configparser.ConfigParser:
+    """
+    Read a .conf file, reusing the parsed result while the file is unchanged on disk.
+    The returned parser is shared between callers and must be treated as read-only.
+    """
     config_path = os.path.join(config_folder, f"{filename}.conf")
+
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     config = configparser.ConfigParser(comment_prefixes=("#"))
     config.read(config_path)
+    _CONFIG_CACHE[config_path] = (mtime, config)
     return config
 
 
@@ -165,6 +184,7 @@ def normalize_path(path: str) -> str:
     return path.replace('\\', '/')
 
 
+@lru_cache(maxsize=None)
 def get_vitis_install_dir() -> str:
     """
     Get Vitis installation directory with forward slashes (CMake-compatible).
@@ -176,6 +196,7 @@ def get_vitis_install_dir() -> str:
     return normalize_path(vitis_root)
 
 
+@lru_cache(maxsize=None)
 def get_workspace_root() -> str:
     """
     Get workspace root directory (Projects/) with forward slashes.
@@ -186,6 +207,7 @@ def get_workspace_root() -> str:
     return normalize_path(PROJECTS_PATH)
 
 
+@lru_cache(maxsize=None)
 def get_src_root() -> str:
     """
     Get source root directory with forward slashes.
@@ -1,12 +1,6 @@
-import argparse
 import configparser
-from functools import partial
-import inspect
 import os
-from pathlib import Path
 import re
-import shutil
-import sys
 from typing import List, TypeVar
 
 # Add package: Vitis Python CLI
@@ -14,11 +8,15 @@ from typing import List, TypeVar
 vitis_client = TypeVar('vitis_client')
 
 from vitis_logging import Logger
-from vitis_paths import read_config, parentdir, PROJECTS_PATH, HDL_DATA_PATH, get_library_path, get_driver_path
+from vitis_paths import read_config, HDL_DATA_PATH, get_library_path, get_driver_path
 
 
 log = Logger("platform")
 
+_DOMAIN_SECTION_RE = re.compile(r"domain_\d+")
+_LIBRARY_SECTION_RE = re.compile(r"library_\d+")
+_DRIVER_SECTION_RE = re.compile(r"driver_\d+")
+
 
 def _edit_bsp_yaml_value(bsp_yaml_path: str, param_name: str, new_value: str) -> None:
     """
@@ -165,7 +163,7 @@ class VitisPlatformDomain(object):
 
     def __configure_libraries(self, domain) -> None:
         """Configure libraries from numbered [library_N] sections."""
-        library_sections = [s for s in self.__config.sections() if re.match(r"library_\d+", s)]
+        library_sections = [s for s in self.__config.sections() if _LIBRARY_SECTION_RE.match(s)]
 
         for section in sorted(library_sections):
             if not self.__config.has_option(section, "name"):
@@ -215,7 +213,7 @@ class VitisPlatformDomain(object):
 
     def __configure_drivers(self, domain) -> None:
         """Configure driver versions from numbered [driver_N] sections."""
-        driver_sections = [s for s in self.__config.sections() if re.match(r"driver_\d+", s)]
+        driver_sections = [s for s in self.__config.sections() if _DRIVER_SECTION_RE.match(s)]
 
         for section in sorted(driver_sections):
             if not self.__config.has_option(section, "name"):
@@ -276,7 +274,7 @@ class VitisPlatform(object):
             self.__config.get("domain", "PROCESSOR_INSTANCE"),
             read_config(self.__config_folder, self.__config.get("domain", "CONFIG")),
         )
-        additional_domains = [name for name in list(self.__config.sections()) if re.match("domain_\d+", name)]
+        additional_domains = [name for name in list(self.__config.sections()) if _DOMAIN_SECTION_RE.match(name)]
         for domain in additional_domains:
             self.__add_domain(
                 self.__config.get(domain, "NAME"),
@@ -1,10 +1,3 @@
-import argparse
-from functools import partial
-import inspect
-import os
-from pathlib import Path
-import shutil
-import sys
 from typing import TypeVar
 
 # Add package: Vitis Python CLI
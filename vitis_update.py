@@ -10,7 +10,7 @@ import configparser
 import os
 import re
 import shutil
-from typing import List, TypeVar
+from typing import TypeVar
 
 vitis_client = TypeVar('vitis_client')
 
@@ -19,13 +19,17 @@ from vitis_paths import read_config, PROJECTS_PATH, TOP_PATH
 from vitis_platform import VitisPlatformDomain
 from vitis_application import (
     _parse_multiline_paths, _expand_path_variables, _create_symlink,
-    _create_folder_symlink, _edit_cmake_variable, _format_optimization_level,
-    _format_debug_level, _bool_to_cmake_flag
+    _create_folder_symlink, _CMakeEditor, _bool_to_cmake_flag, _quoted_csv, _replace_symlink,
+    _section_dict, _parse_bool, _COMPILER_SCALAR_TABLE, _COMPILER_FLAG_TABLE, _LINKER_FLAG_TABLE,
+    _SOURCE_EXTS
 )
 
 
 log = Logger("update")
 
+_DOMAIN_SECTION_RE = re.compile(r"domain_\d+")
+_APP_SECTION_RE = re.compile(r"application_\d+")
+
 
 class ProjectUpdater:
     """Updates an existing Vitis project based on configuration file changes."""
@@ -106,7 +110,7 @@ class ProjectUpdater:
 
         # Handle additional domains
         additional_domains = [s for s in platform_config.sections()
-                             if re.match(r"domain_\d+", s)]
+                             if _DOMAIN_SECTION_RE.match(s)]
 
         for section in sorted(additional_domains):
             domain_name = platform_config.get(section, "NAME")
@@ -145,7 +149,7 @@ class ProjectUpdater:
 
         # Additional applications
         application_sections = [s for s in self.__config_top.sections()
-                               if re.match(r"application_\d+", s)]
+                               if _APP_SECTION_RE.match(s)]
 
         for section in sorted(application_sections):
             self.__update_single_application(section)
@@ -201,7 +205,7 @@ class ProjectUpdater:
 
         # Rebuild additional applications
         application_sections = [s for s in self.__config_top.sections()
-                               if re.match(r"application_\d+", s)]
+                               if _APP_SECTION_RE.match(s)]
 
         for section in sorted(application_sections):
             if self.__config_top.has_option(section, 'NAME'):
@@ -242,10 +246,7 @@ class ApplicationUpdater:
 
     def __update_source_files(self) -> None:
         """Update individual source file symlinks."""
-        if not self.__config.has_option("compiler", "source_files"):
-            return
-
-        sources = self.__config.get("compiler", "source_files").strip()
+        sources = self.__config.get("compiler", "source_files", fallback="").strip()
         if not sources:
             return
 
@@ -265,16 +266,14 @@ class ApplicationUpdater:
         # Add new symlinks
         for filename, source_path in desired_files.items():
             symlink_path = os.path.join(self.__project_src_dir, filename)
-            if not os.path.exists(symlink_path) and not os.path.islink(symlink_path):
+            # lexists is a single lstat and also sees dangling symlinks
+            if not os.path.lexists(symlink_path):
                 log.info(f"Adding source file: {filename}")
                 _create_symlink(source_path, symlink_path)
 
     def __update_source_folders(self) -> None:
         """Update source folder symlinks."""
-        if not self.__config.has_option("compiler", "source_folders"):
-            return
-
-        folders = self.__config.get("compiler", "source_folders").strip()
+        folders = self.__config.get("compiler", "source_folders", fallback="").strip()
         if not folders:
             return
 
@@ -339,7 +338,7 @@ class ApplicationUpdater:
                 # Only include if it contains source files
                 has_sources = False
                 for root, dirs, files in os.walk(item_path):
-                    if any(f.endswith(('.c', '.S')) for f in files):
+                    if any(f.endswith(_SOURCE_EXTS) for f in files):
                         has_sources = True
                         break
                 if has_sources:
@@ -354,7 +353,11 @@ class ApplicationUpdater:
                 os.remove(path)
                 log.info(f"Removed stale symlink: {description}")
             elif os.path.isdir(path):
-                shutil.rmtree(path)
+                try:
+                    # Removes directory junctions (Windows) without touching their target
+                    os.rmdir(path)
+                except OSError:
+                    shutil.rmtree(path)
                 log.info(f"Removed stale directory: {description}")
             elif os.path.isfile(path):
                 os.remove(path)
@@ -370,80 +373,74 @@ class ApplicationUpdater:
             log.warning(f"UserConfig.cmake not found: {userconfig_path}")
             return
 
-        # Update include directories
-        if self.__config.has_option("compiler", "include_directories"):
-            includes = self.__config.get("compiler", "include_directories").strip()
-            if includes:
-                paths = _parse_multiline_paths(includes)
-                expanded_paths = [_expand_path_variables(p) for p in paths]
-                value = '\n'.join(f'"{p}"' for p in expanded_paths)
-                _edit_cmake_variable(userconfig_path, "USER_INCLUDE_DIRECTORIES", f"\n{value}\n")
-                log.info("Updated include directories")
-
-        # Update compile definitions
-        if self.__config.has_option("compiler", "compile_definitions"):
-            defined = self.__config.get("compiler", "compile_definitions").strip()
-            if defined:
-                symbols = [s.strip() for s in defined.split(',')]
-                value = '\n'.join(f'"{s}"' for s in symbols)
-                _edit_cmake_variable(userconfig_path, "USER_COMPILE_DEFINITIONS", f"\n{value}\n")
-                log.info("Updated compile definitions")
-            else:
-                # Clear compile definitions if empty
-                _edit_cmake_variable(userconfig_path, "USER_COMPILE_DEFINITIONS", "")
-
-        # Update undefined symbols
-        if self.__config.has_option("compiler", "undefined_symbols"):
-            undefined = self.__config.get("compiler", "undefined_symbols").strip()
-            if undefined:
-                symbols = [s.strip() for s in undefined.split(',')]
-                value = '\n'.join(f'"{s}"' for s in symbols)
-                _edit_cmake_variable(userconfig_path, "USER_UNDEFINED_SYMBOLS", f"\n{value}\n")
-                log.info("Updated undefined symbols")
-
-        # Update optimization level
-        if self.__config.has_option("compiler", "optimization_level"):
-            level = self.__config.get("compiler", "optimization_level")
-            formatted = _format_optimization_level(level)
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_OPTIMIZATION_LEVEL", formatted)
-
-        # Update debug level
-        if self.__config.has_option("compiler", "debug_level"):
-            level = self.__config.get("compiler", "debug_level")
-            formatted = _format_debug_level(level)
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_DEBUG_LEVEL", formatted)
-
-        # Update warning flags
-        if self.__config.has_option("compiler", "warnings_all"):
-            enabled = self.__config.getboolean("compiler", "warnings_all")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_ALL",
-                                _bool_to_cmake_flag(enabled, "-Wall"))
-
-        if self.__config.has_option("compiler", "warnings_extra"):
-            enabled = self.__config.getboolean("compiler", "warnings_extra")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_EXTRA",
-                                _bool_to_cmake_flag(enabled, "-Wextra"))
-
-        if self.__config.has_option("compiler", "warnings_as_errors"):
-            enabled = self.__config.getboolean("compiler", "warnings_as_errors")
-            _edit_cmake_variable(userconfig_path, "USER_COMPILE_WARNINGS_AS_ERRORS",
-                                _bool_to_cmake_flag(enabled, "-Werror"))
-
-        # Update linker settings
-        if self.__config.has_option("linker", "libraries"):
-            libs = self.__config.get("linker", "libraries").strip()
-            if libs:
-                lib_list = [l.strip() for l in libs.split(',')]
-                value = '\n'.join(f'"{l}"' for l in lib_list)
-                _edit_cmake_variable(userconfig_path, "USER_LINK_LIBRARIES", f"\n{value}\n")
-
-        if self.__config.has_option("linker", "link_directories"):
-            paths = self.__config.get("linker", "link_directories").strip()
-            if paths:
-                path_list = _parse_multiline_paths(paths)
-                expanded_paths = [_expand_path_variables(p) for p in path_list]
-                value = '\n'.join(f'"{p}"' for p in expanded_paths)
-                _edit_cmake_variable(userconfig_path, "USER_LINK_DIRECTORIES", f"\n{value}\n")
+        # Snapshot the sections once, option lookups below are plain dict hits
+        compiler = _section_dict(self.__config, "compiler")
+        linker = _section_dict(self.__config, "linker")
+
+        with _CMakeEditor(userconfig_path) as editor:
+            # Update include directories
+            if "include_directories" in compiler:
+                includes = compiler["include_directories"].strip()
+                if includes:
+                    paths = _parse_multiline_paths(includes)
+                    expanded_paths = [_expand_path_variables(p) for p in paths]
+                    value = '\n'.join(f'"{p}"' for p in expanded_paths)
+                    editor.set("USER_INCLUDE_DIRECTORIES", f"\n{value}\n")
+                    log.info("Updated include directories")
+
+            # Update compile definitions
+            if "compile_definitions" in compiler:
+                defined = compiler["compile_definitions"].strip()
+                if defined:
+                    value = _quoted_csv(defined)
+                    editor.set("USER_COMPILE_DEFINITIONS", f"\n{value}\n")
+                    log.info("Updated compile definitions")
+                else:
+                    # Clear compile definitions if empty
+                    editor.set("USER_COMPILE_DEFINITIONS", "")
+
+            # Update undefined symbols
+            if "undefined_symbols" in compiler:
+                undefined = compiler["undefined_symbols"].strip()
+                if undefined:
+                    value = _quoted_csv(undefined)
+                    editor.set("USER_UNDEFINED_SYMBOLS", f"\n{value}\n")
+                    log.info("Updated undefined symbols")
+
+            # Update optimization, debugging and other verbatim/formatted flags
+            for key, variable, formatter in _COMPILER_SCALAR_TABLE:
+                if key in compiler:
+                    value = compiler[key]
+                    editor.set(variable, formatter(value) if formatter else value)
+
+            # Update warning and misc boolean flags
+            for key, variable, flag in _COMPILER_FLAG_TABLE:
+                if key in compiler:
+                    enabled = _parse_bool(compiler[key])
+                    editor.set(variable, _bool_to_cmake_flag(enabled, flag))
+
+            # Update linker settings
+            for key, variable, flag in _LINKER_FLAG_TABLE:
+                if key in linker:
+                    enabled = _parse_bool(linker[key])
+                    editor.set(variable, _bool_to_cmake_flag(enabled, flag))
+
+            if "libraries" in linker:
+                libs = linker["libraries"].strip()
+                if libs:
+                    value = _quoted_csv(libs)
+                    editor.set("USER_LINK_LIBRARIES", f"\n{value}\n")
+
+            if "link_directories" in linker:
+                paths = linker["link_directories"].strip()
+                if paths:
+                    path_list = _parse_multiline_paths(paths)
+                    expanded_paths = [_expand_path_variables(p) for p in path_list]
+                    value = '\n'.join(f'"{p}"' for p in expanded_paths)
+                    editor.set("USER_LINK_DIRECTORIES", f"\n{value}\n")
+
+            if "other_flags" in linker:
+                editor.set("USER_LINK_OTHER_FLAGS", linker["other_flags"])
 
         log.info("UserConfig.cmake updated")
 
@@ -459,14 +456,6 @@ class ApplicationUpdater:
         expanded = _expand_path_variables(script)
         linker_symlink = os.path.join(self.__project_src_dir, "lscript.ld")
 
-        # Remove existing symlink/file
-        if os.path.exists(linker_symlink) or os.path.islink(linker_symlink):
-            try:
-                os.remove(linker_symlink)
-            except Exception as e:
-                log.warning(f"Failed to remove existing linker script: {e}")
-                return
-
-        # Create new symlink
-        _create_symlink(expanded, linker_symlink)
-        log.info(f"Updated linker script symlink")
+        # Swap the symlink in place, the old one is replaced in a single rename
+        if _replace_symlink(expanded, linker_symlink):
+            log.info(f"Updated linker script symlink")